@@ -44,8 +44,11 @@ def analyze_webpage_structure():
         print("Waiting for page to load...")
         time.sleep(5)
         
-        # Get page source
-        page_source = driver.page_source
+        # Get page source via CDP (faster than the WebDriver page_source command)
+        page_source = driver.execute_cdp_cmd(
+            "Runtime.evaluate",
+            {"expression": "document.documentElement.outerHTML", "returnByValue": True}
+        )["result"]["value"]
         soup = BeautifulSoup(page_source, 'html.parser')
         
         print("\n" + "="*80)
@@ -12,24 +12,58 @@ Usage:
 """
 
 import argparse
-import json
+import os
 import sys
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.formatters.study_print_formatter import StudyBiblePrintFormatter
+from src.utils.storage import read_json
 
+# Repository root; chapter data lives under its data/ directory
+DEFAULT_BASE_DIR = Path(__file__).resolve().parent.parent
 
-def discover_chapters(book: str) -> Set[int]:
+# Pattern: chapter_1.json (in data/processed/{book}/)
+PROCESSED_CHAPTER_RE = re.compile(r'chapter_(\d+)\.json')
+
+
+def _scan_chapter_numbers(directory: Path, pattern: re.Pattern) -> Set[int]:
+    """
+    Collect chapter numbers from the names of files in a directory.
+    
+    Uses os.scandir so file types come from the directory listing rather
+    than a stat() per entry.
+    
+    Args:
+        directory: Directory to scan (may not exist)
+        pattern: Regex whose first group is the chapter number
+        
+    Returns:
+        Set of chapter numbers whose file names fully match the pattern
+    """
+    chapters = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                match = pattern.fullmatch(entry.name)
+                if match and entry.is_file():
+                    chapters.add(int(match.group(1)))
+    except FileNotFoundError:
+        pass
+    return chapters
+
+
+def discover_chapters(book: str, base_dir: Path = DEFAULT_BASE_DIR) -> Set[int]:
     """
     Discover available chapter data files for a given book.
     
     Args:
         book: Book name (e.g., "Psalms")
+        base_dir: Directory containing data/ (default: repository root)
         
     Returns:
         Set of chapter numbers that have data files available
@@ -39,36 +73,17 @@ def discover_chapters(book: str) -> Set[int]:
         - data/samples/{book_lower}_{chapter}_sample.json
         - data/processed/{book}/chapter_{num}.json
     """
-    chapters = set()
-    base_dir = Path(__file__).parent.parent
-    book_lower = book.lower()
+    # Pattern: psalms_83_sample.json
+    sample_pattern = re.compile(rf'{re.escape(book.lower())}_(\d+)_sample\.json')
     
-    # Search in data/samples/
-    samples_dir = base_dir / "data" / "samples"
-    if samples_dir.exists():
-        # Pattern: psalms_83_sample.json
-        pattern = re.compile(rf'^{re.escape(book_lower)}_(\d+)_sample\.json$')
-        for file in samples_dir.iterdir():
-            if file.is_file():
-                match = pattern.match(file.name)
-                if match:
-                    chapters.add(int(match.group(1)))
-    
-    # Search in data/processed/{book}/
-    processed_dir = base_dir / "data" / "processed" / book
-    if processed_dir.exists():
-        # Pattern: chapter_1.json
-        pattern = re.compile(r'^chapter_(\d+)\.json$')
-        for file in processed_dir.iterdir():
-            if file.is_file():
-                match = pattern.match(file.name)
-                if match:
-                    chapters.add(int(match.group(1)))
-    
-    return chapters
+    return (
+        _scan_chapter_numbers(base_dir / "data" / "samples", sample_pattern)
+        | _scan_chapter_numbers(base_dir / "data" / "processed" / book, PROCESSED_CHAPTER_RE)
+    )
 
 
-def load_chapter_data(book: str, chapter: int, data_dir: Path = None) -> Dict[str, Any]:
+def load_chapter_data(book: str, chapter: int, data_dir: Path = None,
+                      base_dir: Path = DEFAULT_BASE_DIR) -> Dict[str, Any]:
     """
     Load chapter data from JSON file.
     
@@ -76,6 +91,7 @@ def load_chapter_data(book: str, chapter: int, data_dir: Path = None) -> Dict[st
         book: Book name (e.g., "Psalms")
         chapter: Chapter number
         data_dir: Base directory for data files (default: data/samples)
+        base_dir: Directory containing data/ (default: repository root)
         
     Returns:
         Dictionary containing chapter data
@@ -86,7 +102,7 @@ def load_chapter_data(book: str, chapter: int, data_dir: Path = None) -> Dict[st
     """
     if data_dir is None:
         # Try data/samples first (for testing)
-        data_dir = Path(__file__).parent.parent / "data" / "samples"
+        data_dir = base_dir / "data" / "samples"
     
     # Construct filename (e.g., "psalms_83_sample.json")
     book_lower = book.lower()
@@ -95,7 +111,7 @@ def load_chapter_data(book: str, chapter: int, data_dir: Path = None) -> Dict[st
     
     if not filepath.exists():
         # Try alternate location: data/processed/{book}/chapter_{num}.json
-        data_dir = Path(__file__).parent.parent / "data" / "processed" / book
+        data_dir = base_dir / "data" / "processed" / book
         filepath = data_dir / f"chapter_{chapter}.json"
     
     if not filepath.exists():
@@ -105,8 +121,7 @@ def load_chapter_data(book: str, chapter: int, data_dir: Path = None) -> Dict[st
             f"Please scrape this chapter first or check the file location."
         )
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return read_json(str(filepath))
 
 
 def generate_chapter(
@@ -114,7 +129,9 @@ def generate_chapter(
     chapter: int,
     output_format: str,
     output_dir: Path,
-    formatter: StudyBiblePrintFormatter
+    formatter: StudyBiblePrintFormatter,
+    base_dir: Path = DEFAULT_BASE_DIR,
+    data: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Generate HTML/PDF for a single chapter.
@@ -125,6 +142,8 @@ def generate_chapter(
         output_format: 'html', 'pdf', or 'both'
         output_dir: Base output directory
         formatter: StudyBiblePrintFormatter instance
+        base_dir: Directory containing data/ (default: repository root)
+        data: Chapter data already in memory (default: load it from base_dir)
         
     Returns:
         Dictionary with 'success' (bool), 'files' (list), and 'error' (str if failed)
@@ -138,8 +157,9 @@ def generate_chapter(
     }
     
     try:
-        # Load chapter data
-        data = load_chapter_data(book, chapter)
+        # Load chapter data unless the caller already has it
+        if data is None:
+            data = load_chapter_data(book, chapter, base_dir=base_dir)
         
         # Create output directory structure
         book_dir = output_dir / book
@@ -13,6 +13,8 @@ SCRAPING_CONFIG = {
     'headless': True,           # Run browser in headless mode
     'wait_time': 10,            # Default wait time for elements (seconds)
     'page_load_timeout': 30,    # Page load timeout (seconds)
+    'parser': 'bs4',            # HTML backend: 'bs4' or 'selectolax' (optional dependency, opt-in)
+    'strain_html': True,        # bs4 backend: only build content containers (False = full tree)
     
     # Rate limiting
     'request_delay': 3,         # Delay between requests (seconds)
@@ -3,8 +3,29 @@ Formatters module for Bible content.
 
 This module contains formatters for converting scraped Bible data
 into various output formats (HTML, PDF) suitable for printing.
+
+Formatter classes are imported on first access, so importing the package
+(or a sibling module) does not load them.
 """
 
-from src.formatters.study_print_formatter import StudyBiblePrintFormatter
+import importlib
+
+# Public name -> submodule defining it
+_LAZY_ATTRS = {
+    'StudyBiblePrintFormatter': 'study_print_formatter',
+}
 
 __all__ = ['StudyBiblePrintFormatter']
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f'{__name__}.{_LAZY_ATTRS[name]}')
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
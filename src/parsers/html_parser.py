@@ -12,6 +12,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based lxml parser; fall back to the pure-Python parser if missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 
 class StudyBibleParser:
     """
@@ -28,7 +35,7 @@ class StudyBibleParser:
         Args:
             html_content: Raw HTML string
         """
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+        self.soup = BeautifulSoup(html_content, HTML_PARSER)
         
     def extract_verses(self) -> List[Dict[str, str]]:
         """
@@ -6,24 +6,122 @@ including Bible text, study notes, footnotes, and cross-references.
 
 Usage:
     python -m src.scrapers.bible_scraper
+
+    with BibleScraper() as scraper:
+        books = scraper.get_books_list()
 """
 
+import os
+import json
 import time
+import atexit
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by the application (see main()); stay silent otherwise
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# In-browser extraction scripts. The browser already holds the parsed DOM, so
+# these return only the small structured result instead of shipping the whole
+# page source back over the WebDriver bridge for re-parsing.
+BOOKS_LIST_SCRIPT = """
+return Array.from(document.querySelectorAll('a.bookLink'), a => ({
+    name: a.innerText.trim(),
+    url: a.getAttribute('href') || '',
+    has_study_notes: a.classList.contains('gem')
+}));
+"""
+
+CHAPTER_VERSES_SCRIPT = """
+return Array.from(document.querySelectorAll('p.verse'), p => ({
+    number: p.querySelector('span.v')?.innerText,
+    text: p.innerText
+}));
+"""
+
+
+@dataclass(slots=True)
+class ChapterData:
+    """Content scraped for a single chapter."""
+    chapter: int
+    verses: List[Dict[str, str]] = field(default_factory=list)
+    study_notes: List[Dict[str, str]] = field(default_factory=list)
+    footnotes: List[Dict[str, str]] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the chapter as a plain dictionary for serialization."""
+        return asdict(self)
+
+
+def create_driver(headless: bool = True) -> webdriver.Chrome:
+    """
+    Launch a Chrome WebDriver.
+    
+    Args:
+        headless: Run browser in headless mode
+        
+    Returns:
+        A new Chrome WebDriver
+    """
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    
+    try:
+        driver = webdriver.Chrome(options=options)
+        logger.info("WebDriver initialized successfully")
+        return driver
+    except Exception as e:
+        logger.error(f"Failed to initialize WebDriver: {e}")
+        raise
+
+
+_shared_driver = None
+_shared_driver_lock = threading.Lock()
+
+
+@contextmanager
+def shared_driver(headless: bool = True):
+    """
+    Yield a process-wide WebDriver reused across all scraper instances.
+    
+    The browser is launched on first use and kept alive until the process
+    exits (or close_shared_driver() is called), so the Chrome cold start is
+    paid once per process rather than once per scraper.
+    
+    Example:
+        with shared_driver() as driver:
+            scraper = BibleScraper(driver=driver)
+            books = scraper.get_books_list()
+    """
+    global _shared_driver
+    with _shared_driver_lock:
+        if _shared_driver is None:
+            _shared_driver = create_driver(headless)
+    yield _shared_driver
+
+
+@atexit.register
+def close_shared_driver():
+    """Close the process-wide WebDriver if one was started."""
+    global _shared_driver
+    with _shared_driver_lock:
+        if _shared_driver is not None:
+            _shared_driver.quit()
+            _shared_driver = None
+            logger.info("Shared WebDriver closed")
 
 
 class BibleScraper:
@@ -35,47 +133,94 @@ class BibleScraper:
     """
     
     BASE_URL = "https://www.jw.org/en/library/bible/study-bible/books/"
+    _URL_PREFIX = BASE_URL.rstrip('/')
+    BOOKS_CACHE_TTL = 86400 * 30  # The books list essentially never changes
     
-    def __init__(self, headless: bool = True, wait_time: int = 10):
+    def __init__(self, headless: bool = True, wait_time: int = 10,
+                 cache_dir: Optional[str] = 'data/cache', driver=None):
         """
         Initialize the scraper.
         
         Args:
             headless: Run browser in headless mode
             wait_time: Maximum wait time for elements (seconds)
+            cache_dir: Directory for the on-disk books list cache (None disables it)
+            driver: Existing WebDriver to reuse (e.g. from shared_driver());
+                the scraper will not quit a driver it did not create
         """
         self.headless = headless
         self.wait_time = wait_time
-        self.driver = None
+        self.cache_dir = cache_dir
+        self.driver = driver
+        self._owns_driver = driver is None
+        
+    def __enter__(self) -> 'BibleScraper':
+        if not self.driver:
+            self.setup_driver()
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.close_driver()
         
     def setup_driver(self):
         """Set up Selenium WebDriver."""
-        options = webdriver.ChromeOptions()
-        if self.headless:
-            options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        
-        try:
-            self.driver = webdriver.Chrome(options=options)
-            logger.info("WebDriver initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize WebDriver: {e}")
-            raise
+        self.driver = create_driver(self.headless)
+        self._owns_driver = True
             
     def close_driver(self):
-        """Close the WebDriver."""
-        if self.driver:
+        """Close the WebDriver (shared drivers are left running)."""
+        if self.driver and self._owns_driver:
             self.driver.quit()
+            self.driver = None
             logger.info("WebDriver closed")
             
+    def _books_cache_path(self) -> Optional[str]:
+        """Return the books list cache file for the current BASE_URL."""
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha1(self.BASE_URL.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"books_{key}.json")
+        
+    def _load_cached_books(self) -> Optional[List[Dict[str, str]]]:
+        """Load the books list from the on-disk cache if present and fresh."""
+        path = self._books_cache_path()
+        if path is None:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) > self.BOOKS_CACHE_TTL:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+            
+    def _save_cached_books(self, books: List[Dict[str, str]]):
+        """Store the books list in the on-disk cache."""
+        path = self._books_cache_path()
+        if path is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(books, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Could not write books list cache: {e}")
+            
     def get_books_list(self) -> List[Dict[str, str]]:
         """
         Retrieve the list of all Bible books.
         
+        The result is cached on disk (keyed by BASE_URL), so a cache hit
+        returns without starting the WebDriver at all.
+        
         Returns:
             List of dictionaries containing book information
         """
+        cached = self._load_cached_books()
+        if cached is not None:
+            logger.info(f"Loaded {len(cached)} books from cache")
+            return cached
+            
         if not self.driver:
             self.setup_driver()
             
@@ -93,20 +238,10 @@ class BibleScraper:
                 EC.presence_of_element_located((By.CLASS_NAME, "bookLink"))
             )
             
-            # Parse page with BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # Find all book links (this selector may need adjustment)
-            book_elements = soup.find_all('a', class_='bookLink')
-            
-            for book in book_elements:
-                book_data = {
-                    'name': book.get_text(strip=True),
-                    'url': book.get('href', ''),
-                    'has_study_notes': 'gem' in book.get('class', [])
-                }
+            # Extract book links in the browser (this selector may need adjustment)
+            for book_data in self.driver.execute_script(BOOKS_LIST_SCRIPT) or []:
                 books.append(book_data)
-                logger.debug(f"Found book: {book_data['name']}")
+                logger.debug("Found book: %s", book_data['name'])
                 
         except TimeoutException:
             logger.warning("Timeout waiting for books list to load")
@@ -114,9 +249,11 @@ class BibleScraper:
             logger.error(f"Error fetching books list: {e}")
             
         logger.info(f"Found {len(books)} books")
+        if books:
+            self._save_cached_books(books)
         return books
         
-    def get_chapter_content(self, book_url: str, chapter: int) -> Dict:
+    def get_chapter_content(self, book_url: str, chapter: int) -> ChapterData:
         """
         Retrieve content for a specific chapter.
         
@@ -125,24 +262,19 @@ class BibleScraper:
             chapter: Chapter number
             
         Returns:
-            Dictionary containing chapter content
+            ChapterData containing chapter content (use to_dict() to serialize)
         """
         if not self.driver:
             self.setup_driver()
             
         # Construct full URL
-        full_url = f"{self.BASE_URL.rstrip('/')}{book_url}/{chapter}/"
-        logger.info(f"Fetching chapter content from {full_url}")
+        full_url = f"{self._URL_PREFIX}{book_url}/{chapter}/"
+        logger.info("Fetching chapter content from %s", full_url)
         
         self.driver.get(full_url)
         time.sleep(2)
         
-        chapter_data = {
-            'chapter': chapter,
-            'verses': [],
-            'study_notes': [],
-            'footnotes': []
-        }
+        chapter_data = ChapterData(chapter=chapter)
         
         try:
             # Wait for verse content to load
@@ -150,19 +282,15 @@ class BibleScraper:
                 EC.presence_of_element_located((By.CLASS_NAME, "verse"))
             )
             
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # Extract verses (selectors may need adjustment based on actual HTML)
-            verses = soup.find_all('p', class_='verse')
+            # Extract verses in the browser (selectors may need adjustment based on actual HTML)
+            verses = self.driver.execute_script(CHAPTER_VERSES_SCRIPT) or []
             
             for verse in verses:
-                verse_num = verse.find('span', class_='v')
-                verse_text = verse.get_text(strip=True)
-                
-                if verse_num:
-                    chapter_data['verses'].append({
-                        'number': verse_num.get_text(strip=True),
-                        'text': verse_text
+                # Paragraphs without a span.v verse number are skipped
+                if verse.get('number') is not None:
+                    chapter_data.verses.append({
+                        'number': verse['number'].strip(),
+                        'text': verse['text'].strip()
                     })
                     
         except TimeoutException:
@@ -204,13 +332,13 @@ class BibleScraper:
         logger.info("Starting full Bible scrape")
         
         try:
-            self.setup_driver()
+            # The driver is started lazily, so a cached books list skips it
             books = self.get_books_list()
             
             all_content = []
             
             for book in books:
-                logger.info(f"Scraping: {book['name']}")
+                logger.info("Scraping: %s", book['name'])
                 # Add delay to be respectful to the server
                 time.sleep(3)
                 
@@ -226,6 +354,10 @@ class BibleScraper:
 
 def main():
     """Main entry point for the scraper."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     scraper = BibleScraper(headless=True)
     
     try:
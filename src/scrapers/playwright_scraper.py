@@ -12,14 +12,38 @@ For actual usage, you would use the playwright-browser tools available in this e
 import time
 import logging
 import json
-from typing import Dict, List, Optional
+import functools
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by the application (see main()); stay silent otherwise
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# The books list instructions never change, so one read-only copy is shared
+BOOKS_LIST_INSTRUCTIONS = MappingProxyType({
+    "step_1": "playwright-browser_navigate to BASE_URL",
+    "step_2": "playwright-browser_wait_for with text or time to ensure page loaded",
+    "step_3": "playwright-browser_snapshot to get page structure",
+    "step_4": "Identify book link elements from snapshot",
+    "step_5": "Extract book names and URLs",
+    "note": "This is a guide for manual usage with MCP Playwright tools"
+})
+
+
+@functools.lru_cache(maxsize=2048)  # Room for every chapter of the Bible (1189)
+def _chapter_instructions(url_prefix: str, book_url: str, chapter: int) -> Mapping[str, str]:
+    """Build the read-only chapter instructions once per (prefix, book, chapter)."""
+    full_url = f"{url_prefix}{book_url}/{chapter}/"
+    
+    return MappingProxyType({
+        "step_1": f"playwright-browser_navigate to {full_url}",
+        "step_2": "playwright-browser_wait_for to ensure content loaded",
+        "step_3": "playwright-browser_snapshot to get page structure",
+        "step_4": "Identify verse elements, study notes, footnotes from snapshot",
+        "step_5": "Extract structured data",
+        "note": "Use Playwright tools for actual implementation"
+    })
 
 
 class PlaywrightBibleScraper:
@@ -34,6 +58,7 @@ class PlaywrightBibleScraper:
     """
     
     BASE_URL = "https://www.jw.org/en/library/bible/study-bible/books/"
+    _URL_PREFIX = BASE_URL.rstrip('/')
     
     def __init__(self, headless: bool = True, wait_time: int = 10000):
         """
@@ -47,43 +72,29 @@ class PlaywrightBibleScraper:
         self.wait_time = wait_time
         logger.info("Playwright Bible Scraper initialized")
         
-    def get_books_list_instructions(self) -> Dict[str, str]:
+    def get_books_list_instructions(self) -> Mapping[str, str]:
         """
         Get instructions for scraping the books list using Playwright MCP.
         
         Returns:
-            Dictionary with step-by-step instructions for using Playwright tools
+            Read-only mapping with step-by-step instructions for using Playwright tools
         """
-        return {
-            "step_1": "playwright-browser_navigate to BASE_URL",
-            "step_2": "playwright-browser_wait_for with text or time to ensure page loaded",
-            "step_3": "playwright-browser_snapshot to get page structure",
-            "step_4": "Identify book link elements from snapshot",
-            "step_5": "Extract book names and URLs",
-            "note": "This is a guide for manual usage with MCP Playwright tools"
-        }
+        return BOOKS_LIST_INSTRUCTIONS
     
-    def get_chapter_content_instructions(self, book_url: str, chapter: int) -> Dict[str, str]:
+    def get_chapter_content_instructions(self, book_url: str, chapter: int) -> Mapping[str, str]:
         """
         Get instructions for scraping chapter content using Playwright MCP.
         
+        The mapping is built once per chapter and shared between calls.
+        
         Args:
             book_url: URL path to the book
             chapter: Chapter number
             
         Returns:
-            Dictionary with step-by-step instructions
+            Read-only mapping with step-by-step instructions
         """
-        full_url = f"{self.BASE_URL.rstrip('/')}{book_url}/{chapter}/"
-        
-        return {
-            "step_1": f"playwright-browser_navigate to {full_url}",
-            "step_2": "playwright-browser_wait_for to ensure content loaded",
-            "step_3": "playwright-browser_snapshot to get page structure",
-            "step_4": "Identify verse elements, study notes, footnotes from snapshot",
-            "step_5": "Extract structured data",
-            "note": "Use Playwright tools for actual implementation"
-        }
+        return _chapter_instructions(self._URL_PREFIX, book_url, chapter)
 
 
 class PlaywrightScraperHelpers:
@@ -173,6 +184,10 @@ playwright-browser_close()
 
 def main():
     """Main entry point showing usage pattern."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     scraper = PlaywrightBibleScraper(headless=True)
     
     print("Playwright Bible Scraper")
@@ -15,27 +15,171 @@ Note: JW.org may block automated access. This module provides both:
 - Sample data fallback (for testing and development)
 """
 
+import copy
+import functools
+import io
+import itertools
 import json
 import logging
 import os
 import re
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from html import escape
+from typing import Dict, Iterator, List, Optional, Any, TextIO, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-# Import selectors from config
+# Prefer the C-based lxml parser; fall back to the pure-Python parser if missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional: orjson serializes chapter data much faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: selectolax (lexbor) backs the faster parse_html_content_fast path
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Verse numbers are the first run of digits in span.verseNum
+VERSE_NUM_RE = re.compile(r'\d+')
+
+# Inline marker classes (LIVE-VERIFIED: a.fn, a.study-note-ref), matched as sets
+FOOTNOTE_MARKER_CLASSES = frozenset({'fn'})
+XREF_MARKER_CLASSES = frozenset({'study-note-ref'})
+MARKER_CLASSES = FOOTNOTE_MARKER_CLASSES | XREF_MARKER_CLASSES
+
+
+def _is_marker(tag) -> bool:
+    """Match footnote/cross-reference marker links without bs4 class normalization."""
+    return tag.name == 'a' and not MARKER_CLASSES.isdisjoint(tag.get('class', ()))
+
+
+# Classes of the sidebar containers holding study notes, footnotes and xrefs
+SIDEBAR_CLASSES = frozenset({'tabSubSection', 'xRef'})
+
+
+def _is_sidebar_container(tag) -> bool:
+    """Match any div the sidebar extractors read from."""
+    return tag.name == 'div' and not SIDEBAR_CLASSES.isdisjoint(tag.get('class', ()))
+
+
+# (epoch second, ISO timestamp) for the current second
+_timestamp_cache = (None, '')
+
+# Default save filenames are this run's start time plus a sequence number,
+# which is unique even for several saves within the same second
+_RUN_TAG = datetime.now().strftime('%Y%m%d_%H%M%S')
+_save_counter = itertools.count()
+
+
+def _timestamp() -> str:
+    """
+    Return the current ISO timestamp at one-second resolution.
+    
+    Batch runs parse many chapters per second, so the formatted string is
+    reused until the clock moves on.
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _timestamp_cache[1]
+
+
+# (tag, class) -> field for the single-pass cross-reference scan
+XREF_HEADER_FIELDS = {('span', 'xRefID'): 'marker', ('span', 'targetCitation'): 'citation'}
+XREF_VERSE_FIELDS = {
+    ('span', 'xRefCitation'): 'citation',
+    ('span', 'xRefCategory'): 'category',
+    ('p', 'xRefContent'): 'content',
+}
+
+# (tag name, attrs) lookups in priority order, used with find()/find_all()
+# so no CSS selector has to be compiled per call
+SUPERSCRIPTION_LOOKUPS = (
+    ('div', {'id': 'tt4'}),                  # Psalms-specific (LIVE-VERIFIED)
+    ('sup', {}),                             # Generic superscription (LIVE-VERIFIED)
+    (None, {'class': 'superscription'}),     # Fallback
+    (None, {'class': 'psalm-heading'}),
+    (None, {'class': 'ss'}),
+)
+
+VERSE_LOOKUPS = (
+    ('p', {'class': 'sb'}),                  # LIVE-VERIFIED: verse paragraphs
+    ('p', {'data-pid': True}),               # Fallback: paragraphs with data-pid
+    ('p', {'class': 'verse'}),               # Legacy fallback
+    ('span', {'class': 'verse'}),
+    (None, {'class': 'v'}),
+)
+
+# CSS equivalents of the lookups above for the selectolax path
+SUPERSCRIPTION_CSS = ('div#tt4', 'sup', '.superscription', '.psalm-heading', '.ss')
+VERSE_CSS = ('p.sb', 'p[data-pid]', 'p.verse', 'span.verse', '.v')
+
+
+# Classes of every element a classed lookup or sidebar extractor reads from
+CONTENT_CLASSES = SIDEBAR_CLASSES.union(
+    attrs['class'] for _, attrs in SUPERSCRIPTION_LOOKUPS + VERSE_LOOKUPS if 'class' in attrs
+)
+
+
+def _is_content_class(value: Optional[str]) -> bool:
+    """Match a class attribute (or one of its tokens) naming a content container."""
+    return value is not None and not CONTENT_CLASSES.isdisjoint(value.split())
+
+
+# Only build tags for the containers we extract from (verses, superscription,
+# study notes, footnotes, cross-references); the rest of the page is skipped.
+CONTENT_STRAINER = SoupStrainer(class_=_is_content_class)
+
+# Elements matched by the lookups without a class (div#tt4, sup, p[data-pid]),
+# which the strainer cannot keep; pages containing one are parsed in full
+UNCLASSED_CONTENT_RE = re.compile(
+    r'<(?:sup\b|div\b[^>]*\bid=["\']?tt4\b|p\b[^>]*\bdata-pid\b)', re.IGNORECASE
+)
+
+# Page prolog/epilog for format_for_html(); the body sections are written per chapter
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <title>Psalm 83 - NWT Study Edition</title>
+  <style>
+    body {{ font-family: Georgia, serif; max-width: 800px; margin: 0 auto; padding: 20px; }}
+    h1 {{ text-align: center; color: #333; }}
+    .superscription {{ font-style: italic; text-align: center; margin-bottom: 20px; }}
+    .verse {{ margin: 10px 0; }}
+    .verse-num {{ font-weight: bold; color: #666; margin-right: 5px; }}
+    .study-notes {{ background: #f5f5f5; padding: 20px; margin-top: 30px; border-radius: 5px; }}
+    .note {{ margin: 15px 0; }}
+    .note-ref {{ font-weight: bold; color: #0066cc; }}
+  </style>
+</head>
+<body>
+  <h1>Psalm {chapter}</h1>
+"""
+HTML_FOOTER = "</body>\n</html>"
+
+# Import configuration
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import SELECTORS, SCRAPING_CONFIG
+from utils.storage import read_json, write_bytes
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by the application (see main()); stay silent otherwise
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class Psalms83Scraper:
@@ -49,82 +193,111 @@ class Psalms83Scraper:
     BASE_URL = "https://www.jw.org/en/library/bible/study-bible/books/"
     PSALMS_83_URL = "https://www.jw.org/en/library/bible/study-bible/books/psalms/83/"
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", parser: str = None):
         """
         Initialize the Psalms 83 scraper.
         
         Args:
             data_dir: Base directory for data storage
+            parser: HTML backend, 'selectolax' or 'bs4' (default from SCRAPING_CONFIG)
         """
         self.data_dir = data_dir
+        self.parser = parser or SCRAPING_CONFIG.get('parser', 'bs4')
         self.raw_dir = os.path.join(data_dir, "raw")
         self.processed_dir = os.path.join(data_dir, "processed")
         self.samples_dir = os.path.join(data_dir, "samples")
         
         # Create directories if they don't exist
-        for directory in [self.raw_dir, self.processed_dir, self.samples_dir]:
+        for directory in (self.raw_dir, self.processed_dir, self.samples_dir):
             os.makedirs(directory, exist_ok=True)
             
         logger.info("Psalms83Scraper initialized")
     
-    def get_scraping_workflow(self) -> Dict[str, Any]:
+    def get_scraping_workflow(self, include_snapshot: bool = False) -> Dict[str, Any]:
         """
         Get the complete workflow for scraping Psalms 83 using Playwright MCP.
         
+        Navigation, waiting, the screenshot and HTML extraction run as one
+        playwright-browser_batch_execute call, so the page is loaded and
+        read in a single MCP round-trip.
+        
+        Args:
+            include_snapshot: Add a separate accessibility snapshot step
+                (useful when identifying elements for new selectors)
+        
         Returns:
             Dictionary containing step-by-step workflow instructions
+            (a fresh copy the caller may modify)
         """
+        workflow = copy.deepcopy(self._scraping_workflow)
+        if not include_snapshot:
+            return workflow
+        
+        steps = workflow["steps"]
+        snapshot_step = {
+            "step": 2,
+            "action": "Get page snapshot",
+            "tool": "playwright-browser_snapshot",
+            "params": {},
+            "description": "Get accessibility snapshot for element identification"
+        }
+        later_steps = [{**step, "step": step["step"] + 1} for step in steps[1:]]
+        return {**workflow, "steps": [steps[0], snapshot_step] + later_steps}
+    
+    @functools.cached_property
+    def _scraping_workflow(self) -> Dict[str, Any]:
+        """Workflow dictionary, built once per instance."""
         return {
             "workflow": "Psalms 83 Scraping",
             "target_url": self.PSALMS_83_URL,
             "steps": [
                 {
                     "step": 1,
-                    "action": "Navigate to Psalms 83",
-                    "tool": "playwright-browser_navigate",
-                    "params": {"url": self.PSALMS_83_URL},
-                    "description": "Navigate to the Psalms 83 chapter page"
-                },
-                {
-                    "step": 2,
-                    "action": "Wait for content to load",
-                    "tool": "playwright-browser_wait_for",
-                    "params": {"time": 3},
-                    "description": "Wait for dynamic content to load"
-                },
-                {
-                    "step": 3,
-                    "action": "Take screenshot",
-                    "tool": "playwright-browser_take_screenshot",
+                    "action": "Load page and extract HTML",
+                    "tool": "playwright-browser_batch_execute",
                     "params": {
-                        "filename": "psalms_83_page.jpeg",
-                        "fullPage": True,
-                        "type": "jpeg"
+                        "steps": [
+                            {
+                                "action": "Navigate to Psalms 83",
+                                "tool": "playwright-browser_navigate",
+                                "params": {"url": self.PSALMS_83_URL}
+                            },
+                            {
+                                "action": "Wait for content to load",
+                                "tool": "playwright-browser_wait_for",
+                                "params": {"time": 3}
+                            },
+                            {
+                                "action": "Take screenshot",
+                                "tool": "playwright-browser_take_screenshot",
+                                "params": {
+                                    "filename": "psalms_83_page.jpeg",
+                                    "fullPage": True,
+                                    "type": "jpeg"
+                                }
+                            },
+                            {
+                                "action": "Extract HTML",
+                                "tool": "playwright-browser_evaluate",
+                                "params": {"function": "() => document.body.innerHTML"}
+                            }
+                        ],
+                        "globalExpectation": {
+                            "includeSnapshot": False,
+                            "includeConsole": False,
+                            "includeTabs": False
+                        }
                     },
-                    "description": "Capture screenshot of the page (JPEG format)"
+                    "description": "Navigate, wait, capture a JPEG screenshot and get the raw HTML in one call"
                 },
                 {
-                    "step": 4,
-                    "action": "Get page snapshot",
-                    "tool": "playwright-browser_snapshot",
-                    "params": {},
-                    "description": "Get accessibility snapshot for element identification"
-                },
-                {
-                    "step": 5,
-                    "action": "Extract HTML",
-                    "tool": "playwright-browser_evaluate",
-                    "params": {"function": "() => document.body.innerHTML"},
-                    "description": "Get raw HTML for parsing with BeautifulSoup"
-                },
-                {
-                    "step": 6,
+                    "step": 2,
                     "action": "Parse content",
                     "method": "parse_html_content",
-                    "description": "Use BeautifulSoup to extract structured data"
+                    "description": "Extract structured data from the HTML"
                 },
                 {
-                    "step": 7,
+                    "step": 3,
                     "action": "Format and save",
                     "method": "save_chapter_data",
                     "description": "Save formatted data to JSON"
@@ -140,7 +313,10 @@ class Psalms83Scraper:
     
     def parse_html_content(self, html_content: str) -> Dict[str, Any]:
         """
-        Parse Psalms 83 HTML content using BeautifulSoup.
+        Parse Psalms 83 HTML content.
+        
+        Uses selectolax when it is the configured parser and installed,
+        otherwise BeautifulSoup; both produce the same structure.
         
         Args:
             html_content: Raw HTML string from the page
@@ -148,19 +324,84 @@ class Psalms83Scraper:
         Returns:
             Structured dictionary with extracted content
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if self.parser == 'selectolax' and SELECTOLAX_AVAILABLE:
+            parts = self._extract_parts_fast(html_content)
+        else:
+            parts = self._extract_parts(html_content)
+        return self._build_chapter_data(*parts)
+    
+    def _extract_parts(self, html_content: str) -> Tuple:
+        """Run every BeautifulSoup extractor over the page."""
+        # strain_html=False keeps the whole tree, for diagnosing new selectors.
+        # Strain only when every candidate carries a class, so the strained
+        # tree always picks the same elements as a full parse
+        strained = (SCRAPING_CONFIG.get('strain_html', True)
+                    and UNCLASSED_CONTENT_RE.search(html_content) is None)
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=CONTENT_STRAINER if strained else None)
+        superscription = self._extract_superscription(soup)
+        verses = self._extract_verses(soup)
+        
+        # One scan finds every sidebar container; pages without a sidebar
+        # skip the study note/footnote/xref passes
+        tab_sections, xref_containers = self._collect_sidebar(soup)
+        if not tab_sections and not xref_containers:
+            return superscription, verses, [], [], []
+        
+        return (
+            superscription,
+            verses,
+            self._extract_study_notes(tab_sections.get('studyNotes')),
+            self._extract_footnotes(tab_sections.get('footnotes')),
+            self._extract_cross_references(xref_containers)
+        )
+    
+    def parse_html_content_fast(self, html_content: str) -> Dict[str, Any]:
+        """
+        Parse Psalms 83 HTML content using selectolax.
         
+        Walks a lexbor tree regardless of the configured parser. Falls
+        back to BeautifulSoup when selectolax is not installed.
+        
+        Args:
+            html_content: Raw HTML string from the page
+            
+        Returns:
+            Structured dictionary with extracted content
+        """
+        if not SELECTOLAX_AVAILABLE:
+            return self._build_chapter_data(*self._extract_parts(html_content))
+        
+        return self._build_chapter_data(*self._extract_parts_fast(html_content))
+    
+    def _extract_parts_fast(self, html_content: str) -> Tuple:
+        """Run every selectolax extractor over the page."""
+        tree = LexborHTMLParser(html_content)
+        
+        return (
+            self._extract_superscription_fast(tree),
+            self._extract_verses_fast(tree),
+            self._extract_tab_items_fast(tree, SELECTORS['study_note_section'], 'reference', 'a.b'),
+            self._extract_tab_items_fast(tree, SELECTORS['footnote_section'], 'marker', 'a.fn'),
+            self._extract_cross_references_fast(tree)
+        )
+    
+    def _build_chapter_data(self, superscription: Optional[str],
+                            verses: List[Dict[str, Any]],
+                            study_notes: List[Dict[str, Any]],
+                            footnotes: List[Dict[str, Any]],
+                            cross_references: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Assemble the chapter dictionary from extracted parts."""
         data = {
             "book": "Psalms",
             "chapter": 83,
             "url": self.PSALMS_83_URL,
-            "superscription": self._extract_superscription(soup),
-            "verses": self._extract_verses(soup),
-            "study_notes": self._extract_study_notes(soup),
-            "footnotes": self._extract_footnotes(soup),
-            "cross_references": self._extract_cross_references(soup),
+            "superscription": superscription,
+            "verses": verses,
+            "study_notes": study_notes,
+            "footnotes": footnotes,
+            "cross_references": cross_references,
             "metadata": {
-                "scraped_at": datetime.now().isoformat(),
+                "scraped_at": _timestamp(),
                 "source": "jw.org Study Bible"
             }
         }
@@ -169,28 +410,20 @@ class Psalms83Scraper:
         data["metadata"]["total_verses"] = len(data["verses"])
         data["metadata"]["has_superscription"] = bool(data["superscription"])
         
-        logger.info(f"Parsed Psalms 83: {len(data['verses'])} verses, "
-                   f"{len(data['study_notes'])} study notes")
+        logger.info("Parsed Psalms 83: %d verses, %d study notes",
+                    len(data['verses']), len(data['study_notes']))
         
         return data
     
     def _extract_superscription(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract the psalm superscription if present."""
-        # Use live-verified selectors first
-        selectors = [
-            'div#tt4',            # Psalms-specific (LIVE-VERIFIED)
-            'sup',                # Generic superscription (LIVE-VERIFIED)
-            '.superscription',    # Fallback
-            '.psalm-heading',
-            '.ss',
-            'p.superscription'
-        ]
-        
-        for selector in selectors:
-            elem = soup.select_one(selector)
+        # Use live-verified lookups first; the generic ones (e.g. sup) would
+        # match inline verse markup if they ever went ahead of them
+        for name, attrs in SUPERSCRIPTION_LOOKUPS:
+            elem = soup.find(name, attrs)
             if elem:
                 # Remove footnote/xref markers to get clean text
-                for marker in elem.find_all('a', class_=['fn', 'study-note-ref']):
+                for marker in elem.find_all(_is_marker):
                     marker.extract()
                 return elem.get_text(strip=True)
         
@@ -198,109 +431,131 @@ class Psalms83Scraper:
     
     def _extract_verses(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Extract all verses from the chapter."""
-        verses = []
-        
-        # Use live-verified selectors first
-        verse_selectors = [
-            'p.sb',           # LIVE-VERIFIED: verse paragraphs
-            'p[data-pid]',    # Fallback: paragraphs with data-pid
-            'p.verse',        # Legacy fallback
-            'span.verse',
-            '.v'
-        ]
-        
+        # Use live-verified lookups first
         verse_elements = []
-        for selector in verse_selectors:
-            verse_elements = soup.select(selector)
+        # Always in declared priority order: the fallbacks are broader than
+        # p.sb, so letting one go first would pull in non-verse paragraphs
+        for name, attrs in VERSE_LOOKUPS:
+            verse_elements = soup.find_all(name, attrs)
             if verse_elements:
-                logger.info(f"Found {len(verse_elements)} elements with selector: {selector}")
+                logger.info("Found %d elements with lookup: %s %s", len(verse_elements), name or '*', attrs)
                 break
         
-        # Group verse paragraphs by verse number
+        return self._group_verses(self._parse_verse_element(elem) for elem in verse_elements)
+    
+    def _group_verses(self, parsed_elements) -> List[Dict[str, Any]]:
+        """Group parsed verse paragraphs by verse number."""
+        verses = []
         current_verse = None
         verse_parts = []
         
-        for elem in verse_elements:
-            verse_data = self._parse_verse_element(elem)
+        def finish_verse():
+            # Join the paragraphs once, when the verse is complete
+            if len(verse_parts) > 1:
+                current_verse['text'] = ' '.join(verse_parts)
+            verses.append(current_verse)
+        
+        for verse_data in parsed_elements:
             if verse_data:
                 # If this element has a verse number, start a new verse
                 if verse_data.get('number') is not None:
                     # Save previous verse if exists
                     if current_verse:
-                        verses.append(current_verse)
+                        finish_verse()
                     current_verse = verse_data
                     verse_parts = [verse_data['text']]
                 # Otherwise, append text to current verse
                 elif current_verse and verse_data.get('text'):
                     verse_parts.append(verse_data['text'])
-                    current_verse['text'] = ' '.join(verse_parts)
                     # Merge markers
                     current_verse['footnotes'].extend(verse_data.get('footnotes', []))
                     current_verse['cross_references'].extend(verse_data.get('cross_references', []))
         
         # Add the last verse
         if current_verse:
-            verses.append(current_verse)
+            finish_verse()
         
         return verses
     
     def _parse_verse_element(self, elem) -> Optional[Dict[str, Any]]:
-        """Parse a single verse element."""
-        try:
-            # Make a copy to avoid modifying original
-            elem_copy = elem.__copy__()
-            
-            # Extract verse number (LIVE-VERIFIED: span.verseNum)
-            verse_num_elem = elem_copy.find('span', class_='verseNum')
-            verse_number = None
-            if verse_num_elem:
-                verse_text = verse_num_elem.get_text(strip=True)
-                # Extract just the number
-                match = re.search(r'\d+', verse_text)
-                if match:
-                    verse_number = int(match.group())
-                verse_num_elem.extract()  # Remove to get clean text
-            
-            # Extract footnote markers (LIVE-VERIFIED: a.fn)
-            footnote_markers = elem_copy.find_all('a', class_='fn')
-            footnotes = []
-            for marker in footnote_markers:
-                # Get the marker text (usually "*")
-                marker_text = marker.get_text(strip=True)
-                footnotes.append(marker_text)
-                marker.extract()  # Remove marker from text
-            
-            # Extract cross-reference markers (LIVE-VERIFIED: a.study-note-ref)
-            xref_markers = elem_copy.find_all('a', class_='study-note-ref')
-            cross_refs = []
-            for marker in xref_markers:
-                # Get the reference letter (a, b, c, etc.)
-                ref_letter = marker.get_text(strip=True)
-                cross_refs.append(ref_letter)
-                marker.extract()  # Remove marker from text
-            
-            # Get clean text
-            text = elem_copy.get_text(strip=True)
-            
-            if verse_number is not None or text:
-                return {
-                    "number": verse_number,
-                    "text": text,
-                    "footnotes": footnotes,
-                    "cross_references": cross_refs
-                }
-            
-        except Exception as e:
-            logger.error(f"Error parsing verse element: {e}")
+        """
+        Parse a single verse element.
+        
+        Markers are extracted from the element in place rather than from a
+        copy; the soup is private to one parse and nothing reads verse
+        paragraphs after this.
+        """
+        # Extract verse number (LIVE-VERIFIED: span.verseNum)
+        verse_num_elem = elem.find('span', class_='verseNum')
+        verse_number = None
+        if verse_num_elem is not None:
+            verse_number = self._parse_verse_number(verse_num_elem.get_text(strip=True))
+            verse_num_elem.extract()  # Remove to get clean text
+        
+        # Collect footnote (a.fn) and cross-reference (a.study-note-ref)
+        # markers in a single pass over the verse's links (LIVE-VERIFIED)
+        footnotes = []
+        cross_refs = []
+        for anchor in elem.find_all('a'):
+            classes = anchor.get('class') or ()
+            if not FOOTNOTE_MARKER_CLASSES.isdisjoint(classes):
+                footnotes.append(anchor.get_text(strip=True))  # usually "*"
+            elif not XREF_MARKER_CLASSES.isdisjoint(classes):
+                cross_refs.append(anchor.get_text(strip=True))  # a, b, c, ...
+            else:
+                continue
+            anchor.extract()  # Remove marker from text
+        
+        # Get clean text
+        text = elem.get_text(strip=True)
+        
+        if verse_number is not None or text:
+            return {
+                "number": verse_number,
+                "text": text,
+                "footnotes": footnotes,
+                "cross_references": cross_refs
+            }
         
         return None
     
-    def _extract_study_notes(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        """Extract study notes from the tabbed sidebar."""
-        notes = []
+    @staticmethod
+    def _collect_sidebar(soup: BeautifulSoup) -> Tuple[Dict[str, Any], List[Any]]:
+        """
+        Collect the sidebar containers in a single walk of the tree.
         
-        # Use live-verified selector for study notes section in sidebar
-        notes_section = soup.select_one(SELECTORS['study_note_section'])
+        Args:
+            soup: Parsed page
+            
+        Returns:
+            Tuple of (first div.tabSubSection per extra class, div.xRef containers)
+        """
+        tab_sections = {}
+        xref_containers = []
+        for container in soup.find_all(_is_sidebar_container):
+            classes = container.get('class', ())
+            if 'xRef' in classes:
+                xref_containers.append(container)
+            if 'tabSubSection' in classes:
+                for cls in classes:
+                    tab_sections.setdefault(cls, container)
+        return tab_sections, xref_containers
+    
+    @staticmethod
+    def _parse_verse_number(verse_text: str) -> Optional[int]:
+        """Extract just the number from span.verseNum text."""
+        # It is usually bare digits, sometimes followed by other text
+        if verse_text.isdecimal():
+            return int(verse_text)
+        head = verse_text.split(maxsplit=1)
+        if head and head[0].isdecimal():
+            return int(head[0])
+        match = VERSE_NUM_RE.search(verse_text)
+        return int(match.group()) if match else None
+    
+    def _extract_study_notes(self, notes_section) -> List[Dict[str, Any]]:
+        """Extract study notes from the sidebar's div.tabSubSection.studyNotes."""
+        notes = []
         
         if notes_section:
             # Find all study note list items
@@ -324,41 +579,32 @@ class Psalms83Scraper:
                             "content": content
                         })
                 except Exception as e:
-                    logger.error(f"Error parsing study note: {e}")
+                    logger.error("Error parsing study note: %s", e)
         
         return notes
     
-    def _parse_study_note_element(self, elem) -> Optional[Dict[str, Any]]:
+    def _parse_study_note_element(self, elem) -> Dict[str, Any]:
         """Parse a single study note element."""
-        try:
-            note_id = elem.get('id', '')
-            
-            # Extract reference
-            ref_elem = elem.find(['span', 'strong'], class_=['reference', 'ref'])
-            reference = ref_elem.get_text(strip=True) if ref_elem else ''
-            
-            # Extract content
-            content_elem = elem.find(['div', 'p'], class_=['content', 'noteContent'])
-            content = content_elem.get_text(strip=True) if content_elem else elem.get_text(strip=True)
-            
-            return {
-                "id": note_id,
-                "reference": reference,
-                "content": content
-            }
-            
-        except Exception as e:
-            logger.error(f"Error parsing study note: {e}")
+        note_id = elem.get('id', '')
         
-        return None
+        # Extract reference
+        ref_elem = elem.find(['span', 'strong'], class_=['reference', 'ref'])
+        reference = ref_elem.get_text(strip=True) if ref_elem is not None else ''
+        
+        # Extract content
+        content_elem = elem.find(['div', 'p'], class_=['content', 'noteContent'])
+        content = (content_elem if content_elem is not None else elem).get_text(strip=True)
+        
+        return {
+            "id": note_id,
+            "reference": reference,
+            "content": content
+        }
     
-    def _extract_footnotes(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        """Extract footnotes from the tabbed sidebar."""
+    def _extract_footnotes(self, footnote_section) -> List[Dict[str, Any]]:
+        """Extract footnotes from the sidebar's div.tabSubSection.footnotes."""
         footnotes = []
         
-        # Use live-verified selector for footnotes section in sidebar
-        footnote_section = soup.select_one(SELECTORS['footnote_section'])
-        
         if footnote_section:
             # Find all footnote list items
             footnote_items = footnote_section.find_all('li')
@@ -381,11 +627,11 @@ class Psalms83Scraper:
                             "content": content
                         })
                 except Exception as e:
-                    logger.error(f"Error parsing footnote: {e}")
+                    logger.error("Error parsing footnote: %s", e)
         
         return footnotes
     
-    def _extract_cross_references(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_cross_references(self, xref_containers) -> List[Dict[str, Any]]:
         """
         Extract cross-references from the tabbed sidebar including full verse text.
         
@@ -394,62 +640,247 @@ class Psalms83Scraper:
         """
         cross_refs = []
         
-        # Find all cross-reference containers (not using section selector)
-        xref_containers = soup.find_all('div', class_='xRef')
-        
         for container in xref_containers:
-            try:
-                xref_data = {
-                    'id': container.get('data-id', ''),
-                    'verse_id': container.get('data-vs-id', ''),
-                    'marker': '',
-                    'citation': '',
-                    'verses': []
+            xref_data = {
+                'id': container.get('data-id', ''),
+                'verse_id': container.get('data-vs-id', ''),
+                'marker': '',
+                'citation': '',
+                'verses': []
+            }
+            
+            # Collect header fields and verse entries in one walk of the container
+            verses = []
+            self._scan_xref_container(container, xref_data, {}, verses, in_block=False, verse=None)
+            
+            for found in verses:
+                verse_data = {
+                    'citation': found.get('citation', ''),
+                    'category': found.get('category', ''),
+                    'content': found.get('content', '')
                 }
-                
-                # Get marker and citation from the header
-                marker_elem = container.find('span', class_='xRefID')
-                if marker_elem:
-                    xref_data['marker'] = marker_elem.get_text(strip=True)
-                
-                citation_elem = container.find('span', class_='targetCitation')
-                if citation_elem:
-                    xref_data['citation'] = citation_elem.get_text(strip=True)
-                
-                # Get verse content from the collapsible block
-                collapsible = container.find('div', class_='jsCollapsableBlock')
-                if collapsible:
-                    verse_elements = collapsible.find_all('div', class_='xRefVerse')
-                    
-                    for verse_elem in verse_elements:
-                        # Extract citation (e.g., "Exodus 1:8-10")
-                        citation = verse_elem.find('span', class_='xRefCitation')
-                        
-                        # Extract category (e.g., "General")
-                        category = verse_elem.find('span', class_='xRefCategory')
-                        
-                        # Extract the actual verse text
-                        content = verse_elem.find('p', class_='xRefContent')
-                        
-                        verse_data = {
-                            'citation': citation.get_text(strip=True) if citation else '',
-                            'category': category.get_text(strip=True) if category else '',
-                            'content': content.get_text(strip=True) if content else ''
-                        }
-                        
-                        # Only add if has content
-                        if verse_data['citation'] or verse_data['content']:
-                            xref_data['verses'].append(verse_data)
-                
-                # Only add cross-reference if it has a marker
-                if xref_data['marker']:
-                    cross_refs.append(xref_data)
-                    
-            except Exception as e:
-                logger.error(f"Error parsing cross-reference container: {e}")
+                # Only add if has content
+                if verse_data['citation'] or verse_data['content']:
+                    xref_data['verses'].append(verse_data)
+            
+            # Only add cross-reference if it has a marker
+            if xref_data['marker']:
+                cross_refs.append(xref_data)
+        
+        return cross_refs
+    
+    def iter_cross_references_streaming(self, html_content) -> Iterator[Dict[str, Any]]:
+        """
+        Yield cross-references one at a time from an incremental lxml parse.
+        
+        Each div.xRef is processed as soon as its end tag is parsed and then
+        cleared, so peak memory stays near one container even for pages with
+        very large sidebars. Yields the same dictionaries as
+        _extract_cross_references().
+        
+        Args:
+            html_content: Raw HTML as str or UTF-8 bytes
+            
+        Yields:
+            Cross-reference dictionaries in document order
+        """
+        from lxml import etree
+        
+        if isinstance(html_content, str):
+            html_content = html_content.encode('utf-8')
+        
+        for _, elem in etree.iterparse(io.BytesIO(html_content), events=('end',), tag='div',
+                                       html=True, encoding='utf-8'):
+            if 'xRef' not in (elem.get('class') or '').split():
+                continue
+            
+            xref_data = self._parse_xref_element(elem)
+            if xref_data['marker']:
+                yield xref_data
+            
+            # Drop the finished container and any earlier siblings
+            elem.clear()
+            parent = elem.getparent()
+            while elem.getprevious() is not None:
+                del parent[0]
+    
+    @staticmethod
+    def _parse_xref_element(container) -> Dict[str, Any]:
+        """Build a cross-reference dictionary from an lxml div.xRef element."""
+        def classes(el):
+            return (el.get('class') or '').split()
+        
+        def first_text(parent, tag, cls):
+            for el in parent.iter(tag):
+                if cls in classes(el):
+                    return ''.join(t.strip() for t in el.itertext())
+            return ''
+        
+        xref_data = {
+            'id': container.get('data-id', ''),
+            'verse_id': container.get('data-vs-id', ''),
+            'marker': first_text(container, 'span', 'xRefID'),
+            'citation': first_text(container, 'span', 'targetCitation'),
+            'verses': []
+        }
+        
+        collapsible = next((el for el in container.iterdescendants('div')
+                            if 'jsCollapsableBlock' in classes(el)), None)
+        if collapsible is not None:
+            for verse_elem in collapsible.iterdescendants('div'):
+                if 'xRefVerse' not in classes(verse_elem):
+                    continue
+                verse_data = {
+                    'citation': first_text(verse_elem, 'span', 'xRefCitation'),
+                    'category': first_text(verse_elem, 'span', 'xRefCategory'),
+                    'content': first_text(verse_elem, 'p', 'xRefContent')
+                }
+                if verse_data['citation'] or verse_data['content']:
+                    xref_data['verses'].append(verse_data)
+        
+        return xref_data
+    
+    def _extract_superscription_fast(self, tree) -> Optional[str]:
+        """selectolax counterpart of _extract_superscription."""
+        for selector in SUPERSCRIPTION_CSS:
+            node = tree.css_first(selector)
+            if node:
+                for marker in node.css('a.fn, a.study-note-ref'):
+                    marker.decompose()
+                return node.text(strip=True)
+        
+        return None
+    
+    def _extract_verses_fast(self, tree) -> List[Dict[str, Any]]:
+        """selectolax counterpart of _extract_verses."""
+        verse_nodes = []
+        for selector in VERSE_CSS:
+            verse_nodes = tree.css(selector)
+            if verse_nodes:
+                logger.info("Found %d elements with selector: %s", len(verse_nodes), selector)
+                break
+        
+        return self._group_verses(self._parse_verse_node(node) for node in verse_nodes)
+    
+    def _parse_verse_node(self, node) -> Optional[Dict[str, Any]]:
+        """Parse a single verse node; markers are removed from the tree in place."""
+        verse_number = None
+        verse_num_node = node.css_first('span.verseNum')
+        if verse_num_node:
+            verse_number = self._parse_verse_number(verse_num_node.text(strip=True))
+            verse_num_node.decompose()
+        
+        footnotes = []
+        for marker in node.css('a.fn'):
+            footnotes.append(marker.text(strip=True))
+            marker.decompose()
+        
+        cross_refs = []
+        for marker in node.css('a.study-note-ref'):
+            cross_refs.append(marker.text(strip=True))
+            marker.decompose()
+        
+        text = node.text(strip=True)
+        
+        if verse_number is not None or text:
+            return {
+                "number": verse_number,
+                "text": text,
+                "footnotes": footnotes,
+                "cross_references": cross_refs
+            }
+        
+        return None
+    
+    def _extract_tab_items_fast(self, tree, section_selector: str, key: str, key_selector: str) -> List[Dict[str, Any]]:
+        """selectolax counterpart of _extract_study_notes/_extract_footnotes."""
+        items = []
+        
+        section = tree.css_first(section_selector)
+        if section:
+            for item in section.css('li'):
+                key_node = item.css_first(key_selector)
+                content = item.text(strip=True)
+                if content:
+                    items.append({
+                        "id": item.attributes.get('id') or '',
+                        key: key_node.text(strip=True) if key_node else '',
+                        "content": content
+                    })
+        
+        return items
+    
+    def _extract_cross_references_fast(self, tree) -> List[Dict[str, Any]]:
+        """selectolax counterpart of _extract_cross_references."""
+        def text_of(parent, selector):
+            node = parent.css_first(selector)
+            return node.text(strip=True) if node else ''
+        
+        cross_refs = []
+        
+        for container in tree.css('div.xRef'):
+            xref_data = {
+                'id': container.attributes.get('data-id') or '',
+                'verse_id': container.attributes.get('data-vs-id') or '',
+                'marker': text_of(container, 'span.xRefID'),
+                'citation': text_of(container, 'span.targetCitation'),
+                'verses': []
+            }
+            
+            collapsible = container.css_first('div.jsCollapsableBlock')
+            if collapsible:
+                for verse_node in collapsible.css('div.xRefVerse'):
+                    verse_data = {
+                        'citation': text_of(verse_node, 'span.xRefCitation'),
+                        'category': text_of(verse_node, 'span.xRefCategory'),
+                        'content': text_of(verse_node, 'p.xRefContent')
+                    }
+                    if verse_data['citation'] or verse_data['content']:
+                        xref_data['verses'].append(verse_data)
+            
+            if xref_data['marker']:
+                cross_refs.append(xref_data)
         
         return cross_refs
     
+    def _scan_xref_container(self, node, xref_data: Dict[str, Any], seen: Dict[str, bool],
+                             verses: List[Dict[str, str]], in_block: bool,
+                             verse: Optional[Dict[str, str]]) -> None:
+        """
+        Walk an xRef container once, dispatching on (tag, class).
+        
+        The header fields (span.xRefID, span.targetCitation) take the first
+        match anywhere in the container. Verse entries are the div.xRefVerse
+        elements inside the first div.jsCollapsableBlock, and each takes the
+        first span.xRefCitation, span.xRefCategory and p.xRefContent within it.
+        """
+        for child in node.children:
+            if child.name is None:
+                continue
+            classes = child.get('class') or ()
+            
+            for cls in classes:
+                field = XREF_HEADER_FIELDS.get((child.name, cls))
+                if field and not seen.get(field):
+                    xref_data[field] = child.get_text(strip=True)
+                    seen[field] = True
+                if verse is not None:
+                    field = XREF_VERSE_FIELDS.get((child.name, cls))
+                    if field and field not in verse:
+                        verse[field] = child.get_text(strip=True)
+            
+            child_in_block = in_block
+            child_verse = verse
+            if child.name == 'div':
+                if 'jsCollapsableBlock' in classes and 'block' not in seen:
+                    seen['block'] = True
+                    child_in_block = True
+                elif in_block and 'xRefVerse' in classes:
+                    child_verse = {}
+                    verses.append(child_verse)
+            
+            self._scan_xref_container(child, xref_data, seen, verses, child_in_block, child_verse)
+    
     def save_chapter_data(self, data: Dict[str, Any], filename: str = None) -> str:
         """
         Save parsed chapter data to JSON file.
@@ -462,15 +893,18 @@ class Psalms83Scraper:
             Path to saved file
         """
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"psalms_83_{timestamp}.json"
+            filename = f"psalms_83_{_RUN_TAG}_{next(_save_counter)}.json"
         
         filepath = os.path.join(self.processed_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Serialize to bytes once and write them in a single call
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        write_bytes(filepath, payload)
         
-        logger.info(f"Saved Psalms 83 data to {filepath}")
+        logger.info("Saved Psalms 83 data to %s", filepath)
         return filepath
     
     def load_sample_data(self) -> Dict[str, Any]:
@@ -483,141 +917,151 @@ class Psalms83Scraper:
         sample_file = os.path.join(self.samples_dir, "psalms_83_sample.json")
         
         if os.path.exists(sample_file):
-            with open(sample_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(sample_file)
             logger.info("Loaded Psalms 83 sample data")
             return data
         else:
             logger.warning("Sample data file not found")
             return {}
     
-    def format_for_print(self, data: Dict[str, Any]) -> str:
+    def format_for_print(self, data: Dict[str, Any], out: Optional[TextIO] = None) -> Optional[str]:
         """
         Format Psalms 83 data for readable print output.
         
         Args:
             data: Structured chapter data
+            out: Optional text stream to write to instead of returning a string
             
         Returns:
-            Formatted text string
+            Formatted text string, or None when written to out
+        """
+        if out is not None:
+            self.format_for_print_to(data, out)
+            return None
+        buf = io.StringIO()
+        self.format_for_print_to(data, buf)
+        return buf.getvalue()
+    
+    def format_for_print_to(self, data: Dict[str, Any], fp: TextIO) -> None:
         """
-        lines = []
+        Write Psalms 83 print output straight to a file-like object.
+        
+        Args:
+            data: Structured chapter data
+            fp: Text stream to write to
+        """
+        lines = self._iter_print_lines(data)
+        fp.write(next(lines))
+        fp.writelines('\n' + line for line in lines)
+    
+    def _iter_print_lines(self, data: Dict[str, Any]):
+        """Yield the lines of the print layout."""
+        rule = "-" * 60
         
         # Header
-        lines.append("=" * 60)
-        lines.append(f"PSALM {data.get('chapter', 83)}")
-        lines.append("=" * 60)
+        yield "=" * 60
+        yield f"PSALM {data.get('chapter', 83)}"
+        yield "=" * 60
         
         # Superscription
         if data.get('superscription'):
-            lines.append(f"\n{data['superscription']}\n")
+            yield f"\n{data['superscription']}\n"
         
         # Verses
-        lines.append("")
+        yield ""
         for verse in data.get('verses', []):
-            verse_num = verse.get('number', '')
-            verse_text = verse.get('text', '')
-            lines.append(f"  {verse_num}  {verse_text}")
+            yield f"  {verse.get('number', '')}  {verse.get('text', '')}"
         
         # Study Notes
         if data.get('study_notes'):
-            lines.append("\n" + "-" * 60)
-            lines.append("STUDY NOTES")
-            lines.append("-" * 60)
+            yield "\n" + rule
+            yield "STUDY NOTES"
+            yield rule
             for note in data['study_notes']:
-                ref = note.get('reference', '')
-                content = note.get('content', '')
-                lines.append(f"\n{ref}")
-                lines.append(f"  {content}")
+                yield f"\n{note.get('reference', '')}"
+                yield f"  {note.get('content', '')}"
         
         # Footnotes
         if data.get('footnotes'):
-            lines.append("\n" + "-" * 60)
-            lines.append("FOOTNOTES")
-            lines.append("-" * 60)
+            yield "\n" + rule
+            yield "FOOTNOTES"
+            yield rule
             for fn in data['footnotes']:
-                lines.append(f"\n  {fn.get('content', '')}")
+                yield f"\n  {fn.get('content', '')}"
         
         # Cross-References
         if data.get('cross_references'):
-            lines.append("\n" + "-" * 60)
-            lines.append("CROSS-REFERENCES")
-            lines.append("-" * 60)
+            yield "\n" + rule
+            yield "CROSS-REFERENCES"
+            yield rule
             for xref in data['cross_references']:
                 ref = xref.get('reference', xref.get('id', ''))
-                verses = ', '.join(xref.get('verses', []))
-                lines.append(f"\n{ref}: {verses}")
-        
-        lines.append("\n" + "=" * 60)
+                yield f"\n{ref}: {', '.join(xref.get('verses', []))}"
         
-        return '\n'.join(lines)
+        yield "\n" + "=" * 60
     
-    def format_for_html(self, data: Dict[str, Any]) -> str:
+    def format_for_html(self, data: Dict[str, Any], out: Optional[TextIO] = None) -> Optional[str]:
         """
         Format Psalms 83 data as HTML for display.
         
         Args:
             data: Structured chapter data
+            out: Optional text stream to write to instead of returning a string
             
         Returns:
-            HTML formatted string
+            HTML formatted string, or None when written to out
         """
-        html_parts = []
-        
-        html_parts.append('<!DOCTYPE html>')
-        html_parts.append('<html lang="en">')
-        html_parts.append('<head>')
-        html_parts.append('  <meta charset="UTF-8">')
-        html_parts.append('  <title>Psalm 83 - NWT Study Edition</title>')
-        html_parts.append('  <style>')
-        html_parts.append('    body { font-family: Georgia, serif; max-width: 800px; margin: 0 auto; padding: 20px; }')
-        html_parts.append('    h1 { text-align: center; color: #333; }')
-        html_parts.append('    .superscription { font-style: italic; text-align: center; margin-bottom: 20px; }')
-        html_parts.append('    .verse { margin: 10px 0; }')
-        html_parts.append('    .verse-num { font-weight: bold; color: #666; margin-right: 5px; }')
-        html_parts.append('    .study-notes { background: #f5f5f5; padding: 20px; margin-top: 30px; border-radius: 5px; }')
-        html_parts.append('    .note { margin: 15px 0; }')
-        html_parts.append('    .note-ref { font-weight: bold; color: #0066cc; }')
-        html_parts.append('  </style>')
-        html_parts.append('</head>')
-        html_parts.append('<body>')
+        if out is not None:
+            self.format_for_html_to(data, out)
+            return None
+        buf = io.StringIO()
+        self.format_for_html_to(data, buf)
+        return buf.getvalue()
+    
+    def format_for_html_to(self, data: Dict[str, Any], fp: TextIO) -> None:
+        """
+        Write Psalms 83 HTML straight to a file-like object.
         
-        # Header
-        html_parts.append(f'  <h1>Psalm {data.get("chapter", 83)}</h1>')
+        Args:
+            data: Structured chapter data
+            fp: Text stream to write to
+        """
+        fp.write(HTML_HEAD.format(chapter=int(data.get('chapter', 83))))
         
         # Superscription
         if data.get('superscription'):
-            html_parts.append(f'  <p class="superscription">{data["superscription"]}</p>')
+            fp.write(f'  <p class="superscription">{escape(data["superscription"])}</p>\n')
         
         # Verses
-        html_parts.append('  <div class="verses">')
-        for verse in data.get('verses', []):
-            verse_num = verse.get('number', '')
-            verse_text = verse.get('text', '')
-            html_parts.append(f'    <p class="verse"><span class="verse-num">{verse_num}</span> {verse_text}</p>')
-        html_parts.append('  </div>')
+        fp.write('  <div class="verses">\n')
+        fp.writelines(
+            f'    <p class="verse"><span class="verse-num">{escape(str(verse.get("number", "")))}</span> '
+            f'{escape(verse.get("text", ""))}</p>\n'
+            for verse in data.get('verses', [])
+        )
+        fp.write('  </div>\n')
         
         # Study Notes
         if data.get('study_notes'):
-            html_parts.append('  <div class="study-notes">')
-            html_parts.append('    <h2>Study Notes</h2>')
-            for note in data['study_notes']:
-                ref = note.get('reference', '')
-                content = note.get('content', '')
-                html_parts.append(f'    <div class="note">')
-                html_parts.append(f'      <span class="note-ref">{ref}</span>')
-                html_parts.append(f'      <p>{content}</p>')
-                html_parts.append(f'    </div>')
-            html_parts.append('  </div>')
-        
-        html_parts.append('</body>')
-        html_parts.append('</html>')
+            fp.write('  <div class="study-notes">\n    <h2>Study Notes</h2>\n')
+            fp.writelines(
+                f'    <div class="note">\n'
+                f'      <span class="note-ref">{escape(note.get("reference", ""))}</span>\n'
+                f'      <p>{escape(note.get("content", ""))}</p>\n'
+                f'    </div>\n'
+                for note in data['study_notes']
+            )
+            fp.write('  </div>\n')
         
-        return '\n'.join(html_parts)
+        fp.write(HTML_FOOTER)
 
 
 def main():
     """Main entry point demonstrating the Psalms 83 scraper."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     scraper = Psalms83Scraper()
     
     print("Psalms 83 Scraper Workflow")
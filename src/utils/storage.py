@@ -7,13 +7,120 @@ in various formats (JSON, CSV, etc.).
 
 import json
 import csv
+import functools
+import hashlib
+import itertools
 import os
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional
 from datetime import datetime
 import logging
 
+# Optional: orjson encodes/decodes JSON several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Write buffer for JSON/CSV output, which is emitted in many small chunks
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Default book filenames are this run's start time plus a sequence number,
+# which is unique even for several saves within the same second
+_RUN_TAG = datetime.now().strftime('%Y%m%d_%H%M%S')
+_save_counter = itertools.count()
+
+# SHA-256 of the bytes last written by write_bytes_if_changed(), per path
+_written_digests: Dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _read_bytes_cached(filepath: str, mtime_ns: int, size: int) -> bytes:
+    """Read a file once per (path, mtime, size); a rewrite changes the key."""
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
+def read_json(filepath: str) -> Any:
+    """
+    Load a JSON file, reusing its bytes while the file is unchanged.
+    
+    The file contents are cached rather than the decoded object, so every
+    caller gets its own freshly decoded copy that is safe to modify.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        Decoded JSON data
+    """
+    stat = os.stat(filepath)
+    raw = _read_bytes_cached(filepath, stat.st_mtime_ns, stat.st_size)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def iter_jsonl(filepath: str) -> Iterator[Any]:
+    """
+    Read a JSON Lines file one record at a time.
+    
+    Args:
+        filepath: Path to the JSON Lines file
+        
+    Yields:
+        Decoded records in file order
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(filepath, 'rb', buffering=WRITE_BUFFER_SIZE) as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def write_bytes(filepath: str, data: bytes) -> None:
+    """
+    Write bytes to a file and drop any cached read of it.
+    
+    Args:
+        filepath: Path to write
+        data: File contents
+    """
+    with open(filepath, 'wb') as f:
+        f.write(data)
+    # A rewrite within the filesystem's timestamp granularity can keep the
+    # same (mtime, size) key, so drop cached contents explicitly
+    _read_bytes_cached.cache_clear()
+
+
+def write_bytes_if_changed(filepath: str, data: bytes,
+                           digests: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Write bytes to a file unless the same bytes were already written there.
+    
+    Meant for artifacts such as page screenshots that are usually identical
+    between runs; hashing is much cheaper than rewriting the file.
+    
+    Args:
+        filepath: Path to write
+        data: File contents
+        digests: Path -> SHA-256 hex digest record to check and update
+            (default: one shared by this process); JSON-serializable so
+            callers can persist it between runs
+        
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    if digests is None:
+        digests = _written_digests
+    digest = hashlib.sha256(data).hexdigest()
+    if digests.get(filepath) == digest and os.path.exists(filepath):
+        logger.debug(f"Unchanged, not rewriting {filepath}")
+        return False
+    
+    write_bytes(filepath, data)
+    digests[filepath] = digest
+    return True
+
 
 class DataStorage:
     """Handle storage of scraped Bible data."""
@@ -29,14 +136,21 @@ class DataStorage:
         self.raw_dir = os.path.join(base_dir, 'raw')
         self.processed_dir = os.path.join(base_dir, 'processed')
         
+        # Path prefixes, so building a file path is a single concatenation
+        self._raw_prefix = self.raw_dir + os.sep
+        self._processed_prefix = self.processed_dir + os.sep
+        
         # Create directories if they don't exist
-        os.makedirs(self.raw_dir, exist_ok=True)
-        os.makedirs(self.processed_dir, exist_ok=True)
+        for directory in (self.raw_dir, self.processed_dir):
+            os.makedirs(directory, exist_ok=True)
         
     def save_json(self, data: Dict[str, Any], filename: str, processed: bool = False) -> str:
         """
         Save data as JSON file.
         
+        Processed data is indented for people to read; raw data is written
+        compactly.
+        
         Args:
             data: Dictionary to save
             filename: Name of the file
@@ -45,18 +159,59 @@ class DataStorage:
         Returns:
             Path to saved file
         """
-        directory = self.processed_dir if processed else self.raw_dir
-        filepath = os.path.join(directory, filename)
+        filepath = (self._processed_prefix if processed else self._raw_prefix) + filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS
+                if processed:
+                    option |= orjson.OPT_INDENT_2
+                write_bytes(filepath, orjson.dumps(data, option=option))
+            else:
+                with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                    if processed:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
+                    else:
+                        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+                _read_bytes_cached.cache_clear()
             logger.info(f"Saved JSON data to {filepath}")
             return filepath
         except Exception as e:
             logger.error(f"Error saving JSON: {e}")
             raise
             
+    def save_jsonl(self, records: Iterable[Dict[str, Any]], filename: str, processed: bool = False) -> str:
+        """
+        Save records as JSON Lines, one object per line.
+        
+        Records are written as they are produced, so a whole book never
+        has to be held in memory as one document.
+        
+        Args:
+            records: Dictionaries to save (e.g. one per chapter)
+            filename: Name of the file
+            processed: Whether this is processed data
+            
+        Returns:
+            Path to saved file
+        """
+        filepath = (self._processed_prefix if processed else self._raw_prefix) + filename
+        
+        try:
+            with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                for record in records:
+                    if orjson is not None:
+                        f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS))
+                    else:
+                        f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+                        f.write(b'\n')
+            _read_bytes_cached.cache_clear()
+            logger.info(f"Saved JSON Lines data to {filepath}")
+            return filepath
+        except Exception as e:
+            logger.error(f"Error saving JSON Lines: {e}")
+            raise
+            
     def load_json(self, filename: str, processed: bool = False) -> Dict[str, Any]:
         """
         Load data from JSON file.
@@ -68,12 +223,10 @@ class DataStorage:
         Returns:
             Loaded dictionary
         """
-        directory = self.processed_dir if processed else self.raw_dir
-        filepath = os.path.join(directory, filename)
+        filepath = (self._processed_prefix if processed else self._raw_prefix) + filename
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(filepath)
             logger.info(f"Loaded JSON data from {filepath}")
             return data
         except Exception as e:
@@ -91,35 +244,76 @@ class DataStorage:
         Returns:
             Path to saved file
         """
-        filepath = os.path.join(self.processed_dir, filename)
+        filepath = self._processed_prefix + filename
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
                 if verses:
-                    writer = csv.DictWriter(f, fieldnames=verses[0].keys())
-                    writer.writeheader()
-                    writer.writerows(verses)
+                    # Positional rows skip DictWriter's per-row key checks
+                    fieldnames = list(verses[0])
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    writer.writerows([verse.get(key, '') for key in fieldnames] for verse in verses)
+            _read_bytes_cached.cache_clear()
             logger.info(f"Saved CSV data to {filepath}")
             return filepath
         except Exception as e:
             logger.error(f"Error saving CSV: {e}")
             raise
             
-    def save_book_data(self, book_name: str, book_data: Dict[str, Any]) -> str:
+    def save_book_data(self, book_name: str, book_data: Dict[str, Any], jsonl: bool = False) -> str:
         """
         Save data for a complete book.
         
         Args:
             book_name: Name of the book
             book_data: Complete book data
+            jsonl: Write the book with save_book_jsonl() instead, so it can be
+                read back a chapter at a time (readers must expect .jsonl)
             
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{book_name.replace(' ', '_')}_{timestamp}.json"
+        if jsonl:
+            chapters = book_data.get('chapters') or []
+            metadata = {k: v for k, v in book_data.items() if k != 'chapters'}
+            return self.save_book_jsonl(book_name, chapters, metadata)
+        
+        filename = f"{book_name.replace(' ', '_')}_{_RUN_TAG}_{next(_save_counter)}.json"
         return self.save_json(book_data, filename, processed=False)
         
+    def save_book_jsonl(self, book_name: str, chapters: Iterable[Dict[str, Any]],
+                        metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Save a book as JSON Lines.
+        
+        The first line holds the book-level fields and each following line
+        is one chapter, written as soon as the iterable produces it.
+        
+        Args:
+            book_name: Name of the book
+            chapters: Chapter dictionaries (a list or a generator)
+            metadata: Book-level fields other than the chapters
+            
+        Returns:
+            Path to saved file
+        """
+        header = {'book': book_name, **(metadata or {})}
+        filename = f"{book_name.replace(' ', '_')}_{_RUN_TAG}_{next(_save_counter)}.jsonl"
+        return self.save_jsonl(itertools.chain((header,), chapters), filename, processed=False)
+        
+    def iter_book_jsonl(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """
+        Read a book saved by save_book_jsonl() one line at a time.
+        
+        Args:
+            filename: Name of the file in the raw directory
+            
+        Yields:
+            The book-level header, then each chapter
+        """
+        return iter_jsonl(self._raw_prefix + filename)
+        
     def save_chapter_data(self, book_name: str, chapter: int, chapter_data: Dict[str, Any]) -> str:
         """
         Save data for a specific chapter.
@@ -142,5 +336,5 @@ class DataStorage:
         Returns:
             List of filenames
         """
-        files = [f for f in os.listdir(self.raw_dir) if f.endswith('.json')]
+        files = [f for f in os.listdir(self.raw_dir) if f.endswith(('.json', '.jsonl'))]
         return files
@@ -5,42 +5,272 @@ This module provides validation functions for checking the structure
 and completeness of scraped Bible content.
 """
 
-from typing import Dict, List, Any, Optional
+import functools
+import operator
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Any, Optional, Union
 
+# Optional: fastjsonschema compiles the schemas below into straight-line
+# Python validators, which are much faster than the generic checks
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
-def validate_verse_structure(verse: Dict[str, Any]) -> bool:
+# Required fields, shared by the schemas and the pure-Python checks below so
+# no per-call list of field names is built
+_CHAPTER_FIELDS = ('book', 'chapter', 'verses')
+_NOTE_FIELDS = ('id', 'reference', 'content')
+_FOOTNOTE_FIELDS = ('id', 'content')
+_get_note_fields = operator.itemgetter(*_NOTE_FIELDS)
+_get_footnote_fields = operator.itemgetter(*_FOOTNOTE_FIELDS)
+
+# JSON Schemas mirroring the hand-written checks in the validators below.
+# Strings that must not be blank require at least one non-space character.
+# They are compiled as draft-04, whose 'integer' (like the Python checks)
+# rejects integral floats such as 1.0; every draft rejects booleans.
+_SCHEMA_DRAFT = 'http://json-schema.org/draft-04/schema#'
+_NON_BLANK_STRING = {'type': 'string', 'pattern': r'\S'}
+
+_VERSE_SCHEMA = {
+    'type': 'object',
+    'required': ['number', 'text'],
+    'properties': {
+        'number': {'type': 'integer'},
+        'text': _NON_BLANK_STRING,
+        'footnotes': {'type': 'array'},
+        'cross_references': {'type': 'array'},
+    },
+}
+
+_NOTE_SCHEMA = {
+    'type': 'object',
+    'required': list(_NOTE_FIELDS),
+    'properties': {
+        'id': {'type': 'string'},
+        'reference': {'type': 'string'},
+        'content': _NON_BLANK_STRING,
+    },
+}
+
+_FOOTNOTE_SCHEMA = {
+    'type': 'object',
+    'required': list(_FOOTNOTE_FIELDS),
+    'properties': {
+        'id': {'type': 'string'},
+        'content': _NON_BLANK_STRING,
+    },
+}
+
+_CROSS_REFERENCE_SCHEMA = {
+    'type': 'object',
+    'required': ['id', 'verses'],
+    'properties': {
+        'id': {'type': 'string'},
+        'verses': {'type': 'array', 'minItems': 1, 'items': {'type': 'string'}},
+    },
+}
+
+
+_SCHEMAS = {
+    'verse': _VERSE_SCHEMA,
+    'study_note': _NOTE_SCHEMA,
+    'footnote': _FOOTNOTE_SCHEMA,
+    'cross_reference': _CROSS_REFERENCE_SCHEMA,
+}
+
+# Key words checked by validate_psalms_83_specific, found in one regex pass
+# per text rather than one substring scan per word
+_PSALMS_83_KEYWORDS_RE = re.compile(r'Asaph|Jehovah|Most High|Selah')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_validator(name: str) -> Optional[Callable[[Any], bool]]:
     """
-    Validate that a verse has the expected structure.
+    Compile a schema into a boolean validator, once per process.
     
     Args:
-        verse: Dictionary containing verse data
+        name: Key into _SCHEMAS
         
     Returns:
-        True if valid, False otherwise
+        Function returning True for valid data, or None if fastjsonschema
+        is not installed
     """
-    required_fields = ['number', 'text']
+    if fastjsonschema is None:
+        return None
+    
+    validate = fastjsonschema.compile({'$schema': _SCHEMA_DRAFT, **_SCHEMAS[name]})
     
-    # Check required fields exist
-    for field in required_fields:
-        if field not in verse:
+    def is_valid(data: Any) -> bool:
+        try:
+            validate(data)
+            return True
+        except fastjsonschema.JsonSchemaException:
             return False
     
-    # Validate field types
-    if not isinstance(verse['number'], int):
-        return False
+    return is_valid
+
+
+# Default for optional list fields, so a missing field passes the list check
+_ABSENT_LIST: list = []
+
+
+@functools.lru_cache(maxsize=None)
+def _expected_verse_numbers(count: int) -> tuple:
+    """Return (1, ..., count), built once per chapter length."""
+    return tuple(range(1, count + 1))
+
+
+def _numbering_errors(numbers: tuple) -> List[str]:
+    """
+    Report verses whose number is not their position plus one.
+    
+    A single tuple comparison settles the common case, and only a mismatch
+    is walked per verse.
+    
+    Args:
+        numbers: Verse numbers in chapter order
+        
+    Returns:
+        List of validation error messages (empty if numbering is sequential)
+    """
+    expected_numbers = _expected_verse_numbers(len(numbers))
+    if numbers == expected_numbers:
+        return []
+    return [
+        f"Verse at index {i} has number {number}, expected {expected_num}"
+        for i, (number, expected_num) in enumerate(zip(numbers, expected_numbers))
+        if number != expected_num
+    ]
+
+
+# Fields a Verse record holds
+_VERSE_KEYS = frozenset({'number', 'text', 'footnotes', 'cross_references'})
+
+
+@dataclass(slots=True, frozen=True)
+class Verse:
+    """
+    Compact verse record whose field types are checked once, on construction.
     
-    if not isinstance(verse['text'], str):
+    Uses far less memory than a verse dictionary when many verses are held
+    at once, and validate_verse_structure() only has to check its text.
+    """
+    number: int
+    text: str
+    footnotes: tuple = ()
+    cross_references: tuple = ()
+    
+    def __post_init__(self):
+        if type(self.number) is not int or not isinstance(self.text, str):
+            raise TypeError("Verse number must be an int and text a str")
+        if not isinstance(self.footnotes, tuple) or not isinstance(self.cross_references, tuple):
+            raise TypeError("Verse footnotes and cross_references must be tuples")
+    
+    @classmethod
+    def from_dict(cls, verse: Dict[str, Any]) -> 'Verse':
+        """
+        Build a record from a parsed verse dictionary.
+        
+        Args:
+            verse: Dictionary containing verse data
+            
+        Returns:
+            Verse record
+            
+        Raises:
+            KeyError: If number or text is missing
+            TypeError: If a field has the wrong type
+            ValueError: If the dictionary has fields a Verse cannot hold,
+                which a round trip would otherwise drop
+        """
+        unknown = verse.keys() - _VERSE_KEYS
+        if unknown:
+            raise ValueError(f"Unknown verse fields: {', '.join(sorted(unknown))}")
+        footnotes = verse.get('footnotes', [])
+        cross_references = verse.get('cross_references', [])
+        if not isinstance(footnotes, list) or not isinstance(cross_references, list):
+            raise TypeError("Verse footnotes and cross_references must be lists")
+        return cls(verse['number'], verse['text'], tuple(footnotes), tuple(cross_references))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the verse as a plain dictionary for serialization."""
+        return {
+            'number': self.number,
+            'text': self.text,
+            'footnotes': list(self.footnotes),
+            'cross_references': list(self.cross_references),
+        }
+
+
+@dataclass(slots=True)
+class ChapterColumns:
+    """
+    Column-wise copy of a chapter's verses for batch validation.
+    
+    Each check reads a single column, so validating many chapters held in
+    memory never walks the per-verse dictionaries.
+    """
+    book: str
+    chapter: int
+    numbers: tuple
+    texts: tuple
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChapterColumns':
+        """
+        Build the columns from a parsed chapter dictionary.
+        
+        Args:
+            data: Chapter data with book, chapter and verses
+            
+        Returns:
+            ChapterColumns for the chapter
+        """
+        verses = data['verses']
+        return cls(
+            book=data['book'],
+            chapter=data['chapter'],
+            numbers=tuple([verse.get('number') for verse in verses]),
+            texts=tuple([verse.get('text') for verse in verses]),
+        )
+
+
+def validate_verse_structure(verse: Union[Dict[str, Any], Verse]) -> bool:
+    """
+    Validate that a verse has the expected structure.
+    
+    Args:
+        verse: Dictionary containing verse data, or a Verse record
+        
+    Returns:
+        True if valid, False otherwise
+    """
+    if isinstance(verse, Verse):
+        # Field types were checked when the record was built
+        return bool(verse.text.strip())
+    
+    compiled = _get_validator('verse')
+    if compiled is not None:
+        return compiled(verse)
+    
+    # One lookup per field; a missing required field reads as None and
+    # fails its type check. bool is an int subclass but not a verse number
+    number = verse.get('number')
+    text = verse.get('text')
+    if type(number) is not int or not isinstance(text, str):
         return False
     
     # Verse text should not be empty
-    if len(verse['text'].strip()) == 0:
+    if not text.strip():
         return False
     
     # Optional fields should be lists if present
-    if 'footnotes' in verse and not isinstance(verse['footnotes'], list):
+    if not isinstance(verse.get('footnotes', _ABSENT_LIST), list):
         return False
     
-    if 'cross_references' in verse and not isinstance(verse['cross_references'], list):
+    if not isinstance(verse.get('cross_references', _ABSENT_LIST), list):
         return False
     
     return True
@@ -56,20 +286,21 @@ def validate_study_note(note: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ['id', 'reference', 'content']
-    
-    # Check required fields exist
-    for field in required_fields:
-        if field not in note:
-            return False
-        if not isinstance(note[field], str):
-            return False
+    compiled = _get_validator('study_note')
+    if compiled is not None:
+        return compiled(note)
+    
+    # Fetch all required fields in one call; a missing one raises KeyError
+    try:
+        note_id, reference, content = _get_note_fields(note)
+    except (KeyError, TypeError):
+        return False
     
-    # Content should not be empty
-    if len(note['content'].strip()) == 0:
+    if not (isinstance(note_id, str) and isinstance(reference, str) and isinstance(content, str)):
         return False
     
-    return True
+    # Content should not be empty
+    return bool(content.strip())
 
 
 def validate_footnote(footnote: Dict[str, Any]) -> bool:
@@ -82,18 +313,19 @@ def validate_footnote(footnote: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ['id', 'content']
+    compiled = _get_validator('footnote')
+    if compiled is not None:
+        return compiled(footnote)
     
-    for field in required_fields:
-        if field not in footnote:
-            return False
-        if not isinstance(footnote[field], str):
-            return False
+    try:
+        footnote_id, content = _get_footnote_fields(footnote)
+    except (KeyError, TypeError):
+        return False
     
-    if len(footnote['content'].strip()) == 0:
+    if not (isinstance(footnote_id, str) and isinstance(content, str)):
         return False
     
-    return True
+    return bool(content.strip())
 
 
 def validate_cross_reference(xref: Dict[str, Any]) -> bool:
@@ -106,7 +338,9 @@ def validate_cross_reference(xref: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ['id', 'verses']
+    compiled = _get_validator('cross_reference')
+    if compiled is not None:
+        return compiled(xref)
     
     if 'id' not in xref or not isinstance(xref['id'], str):
         return False
@@ -142,9 +376,14 @@ def validate_chapter_completeness(
     """
     errors = []
     
+    # Resolve each validator once rather than once per item
+    is_valid_verse = _get_validator('verse') or validate_verse_structure
+    is_valid_note = _get_validator('study_note') or validate_study_note
+    is_valid_footnote = _get_validator('footnote') or validate_footnote
+    is_valid_xref = _get_validator('cross_reference') or validate_cross_reference
+    
     # Check required top-level fields
-    required_fields = ['book', 'chapter', 'verses']
-    for field in required_fields:
+    for field in _CHAPTER_FIELDS:
         if field not in data:
             errors.append(f"Missing required field: {field}")
     
@@ -168,45 +407,75 @@ def validate_chapter_completeness(
                     f"Expected {expected_verses} verses, found {actual_count}"
                 )
             
-            # Validate each verse
-            for i, verse in enumerate(data['verses']):
-                if not validate_verse_structure(verse):
-                    errors.append(f"Invalid verse structure at index {i}")
-                
-                # Check verse numbering is sequential
-                expected_num = i + 1
-                if verse.get('number') != expected_num:
-                    errors.append(
-                        f"Verse at index {i} has number {verse.get('number')}, "
-                        f"expected {expected_num}"
-                    )
+            # Validate each verse; Verse records skip the dict schema
+            errors.extend([
+                f"Invalid verse structure at index {i}"
+                for i, verse in enumerate(data['verses'])
+                if not (validate_verse_structure(verse) if isinstance(verse, Verse) else is_valid_verse(verse))
+            ])
+            
+            # Check verse numbering is sequential
+            errors.extend(_numbering_errors(tuple([
+                verse.number if isinstance(verse, Verse) else verse.get('number')
+                for verse in data['verses']
+            ])))
     
     # Validate study notes if present
     if 'study_notes' in data:
         if not isinstance(data['study_notes'], list):
             errors.append("Study notes should be a list")
         else:
-            for i, note in enumerate(data['study_notes']):
-                if not validate_study_note(note):
-                    errors.append(f"Invalid study note structure at index {i}")
+            errors.extend([
+                f"Invalid study note structure at index {i}"
+                for i, note in enumerate(data['study_notes']) if not is_valid_note(note)
+            ])
     
     # Validate footnotes if present
     if 'footnotes' in data:
         if not isinstance(data['footnotes'], list):
             errors.append("Footnotes should be a list")
         else:
-            for i, fn in enumerate(data['footnotes']):
-                if not validate_footnote(fn):
-                    errors.append(f"Invalid footnote structure at index {i}")
+            errors.extend([
+                f"Invalid footnote structure at index {i}"
+                for i, fn in enumerate(data['footnotes']) if not is_valid_footnote(fn)
+            ])
     
     # Validate cross-references if present
     if 'cross_references' in data:
         if not isinstance(data['cross_references'], list):
             errors.append("Cross-references should be a list")
         else:
-            for i, xref in enumerate(data['cross_references']):
-                if not validate_cross_reference(xref):
-                    errors.append(f"Invalid cross-reference structure at index {i}")
+            errors.extend([
+                f"Invalid cross-reference structure at index {i}"
+                for i, xref in enumerate(data['cross_references']) if not is_valid_xref(xref)
+            ])
+    
+    return errors
+
+
+def validate_chapter_columns(columns: ChapterColumns, expected_verses: int) -> List[str]:
+    """
+    Validate verse count, verse text and numbering of a ChapterColumns.
+    
+    Args:
+        columns: Column-wise chapter data
+        expected_verses: Expected number of verses
+        
+    Returns:
+        List of validation error messages (empty if all valid)
+    """
+    errors = []
+    
+    actual_count = len(columns.numbers)
+    if actual_count != expected_verses:
+        errors.append(f"Expected {expected_verses} verses, found {actual_count}")
+    
+    errors.extend([
+        f"Invalid verse structure at index {i}"
+        for i, text in enumerate(columns.texts)
+        if not isinstance(text, str) or not text.strip()
+    ])
+    errors.extend(_numbering_errors(columns.numbers))
     
     return errors
 
@@ -239,15 +508,15 @@ def validate_psalms_83_specific(data: Dict[str, Any]) -> List[str]:
     if 'superscription' in data:
         if not data['superscription']:
             errors.append("Psalms 83 should have a superscription")
-        elif 'Asaph' not in data['superscription']:
+        elif 'Asaph' not in set(_PSALMS_83_KEYWORDS_RE.findall(data['superscription'])):
             errors.append("Superscription should mention Asaph")
     
     # Verse 18 should contain key words
     if len(verses) >= 18:
-        verse_18_text = verses[17].get('text', '')
-        if 'Jehovah' not in verse_18_text:
+        verse_18_keywords = set(_PSALMS_83_KEYWORDS_RE.findall(verses[17].get('text', '')))
+        if 'Jehovah' not in verse_18_keywords:
             errors.append("Verse 18 should contain 'Jehovah'")
-        if 'Most High' not in verse_18_text:
+        if 'Most High' not in verse_18_keywords:
             errors.append("Verse 18 should contain 'Most High'")
     
     # Should have study notes
@@ -257,41 +526,57 @@ def validate_psalms_83_specific(data: Dict[str, Any]) -> List[str]:
     
     # Should have Selah footnote
     footnotes = data.get('footnotes', [])
-    has_selah = any('Selah' in fn.get('content', '') for fn in footnotes)
+    # Search all footnotes at once; the separator keeps matches from spanning two
+    footnote_text = '\x01'.join([fn.get('content', '') for fn in footnotes])
+    has_selah = 'Selah' in footnote_text
     if not has_selah:
         errors.append("Should have a Selah footnote")
     
     return errors
 
 
-def is_valid_chapter_data(data: Dict[str, Any], expected_verses: int = None) -> bool:
+def is_valid_chapter_shape(data: Dict[str, Any], expected_verses: int = None) -> bool:
     """
-    Quick validation check for chapter data.
+    Cheap pre-filter for chapter data: type, key and verse count checks only.
     
     Args:
         data: Chapter data to validate
         expected_verses: Expected verse count (optional)
         
     Returns:
-        True if data appears valid, False otherwise
+        True if data has the shape of a chapter, False otherwise
     """
     if not isinstance(data, dict):
         return False
     
-    required_fields = ['book', 'chapter', 'verses']
-    for field in required_fields:
-        if field not in data:
-            return False
+    if 'book' not in data or 'chapter' not in data or 'verses' not in data:
+        return False
     
-    if not isinstance(data['verses'], list):
+    verses = data['verses']
+    if not isinstance(verses, list):
         return False
     
-    if expected_verses is not None:
-        if len(data['verses']) != expected_verses:
-            return False
+    return expected_verses is None or len(verses) == expected_verses
+
+
+def is_valid_chapter_data(data: Dict[str, Any], expected_verses: int = None, deep: bool = True) -> bool:
+    """
+    Quick validation check for chapter data.
+    
+    Args:
+        data: Chapter data to validate
+        expected_verses: Expected verse count (optional)
+        deep: Also validate the structure of the first verse; pass False
+            to run only the is_valid_chapter_shape() checks
+        
+    Returns:
+        True if data appears valid, False otherwise
+    """
+    if not is_valid_chapter_shape(data, expected_verses):
+        return False
     
     # Check at least first verse is valid
-    if len(data['verses']) > 0:
+    if deep and data['verses']:
         if not validate_verse_structure(data['verses'][0]):
             return False
     
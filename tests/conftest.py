@@ -5,14 +5,17 @@ This module provides shared fixtures for both unit and integration tests.
 """
 
 import pytest
+import pytest_asyncio
 import os
 import json
-import socket
+import asyncio
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any
 
 # Import scraper classes
 from src.scrapers.psalms_scraper import Psalms83Scraper
+from src.utils.storage import read_json
 
 
 @pytest.fixture
@@ -29,19 +32,67 @@ def samples_dir(data_dir):
 
 @pytest.fixture
 def psalms_83_sample(samples_dir):
-    """Load Psalms 83 sample data."""
+    """
+    Load Psalms 83 sample data.
+    
+    read_json() caches the file's bytes, so only decoding is repeated, and
+    each test gets its own copy that it may modify.
+    """
     sample_file = samples_dir / "psalms_83_sample.json"
     
     if sample_file.exists():
-        with open(sample_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(str(sample_file))
     else:
         pytest.skip("Sample data file not found")
 
 
+@pytest.fixture(scope="session")
+def psalms_83_sample_bytes():
+    """Return the raw Psalms 83 sample JSON, read once per session."""
+    sample_file = Path(__file__).parent.parent / "data" / "samples" / "psalms_83_sample.json"
+    
+    if sample_file.exists():
+        return sample_file.read_bytes()
+    else:
+        pytest.skip("Sample data file not found")
+
+
+@pytest.fixture(scope="session")
+def shared_formatter():
+    """Create one StudyBiblePrintFormatter for the session; it holds no per-chapter state."""
+    from src.formatters.study_print_formatter import StudyBiblePrintFormatter
+    return StudyBiblePrintFormatter()
+
+
+@pytest.fixture(scope="session")
+def psalms_83_html(psalms_83_sample_bytes, shared_formatter):
+    """Render the unmodified Psalms 83 sample to HTML once per session."""
+    return shared_formatter.generate_html(json.loads(psalms_83_sample_bytes))
+
+
+@pytest.fixture(scope="session")
+def psalms_83_pdf(tmp_path_factory, psalms_83_sample_bytes):
+    """
+    Render the Psalms 83 sample to a PDF once per session.
+    
+    PDF rendering is the slowest step in the suite, so tests that only
+    inspect the Psalms 83 PDF share this one file; request it only from
+    tests marked slow.
+    """
+    from src.formatters.study_print_formatter import StudyBiblePrintFormatter
+    formatter = StudyBiblePrintFormatter()
+    output_path = tmp_path_factory.mktemp("pdf") / "psalms_83.pdf"
+    formatter.generate_pdf(json.loads(psalms_83_sample_bytes), str(output_path))
+    return output_path
+
+
 @pytest.fixture
 def psalms_scraper(tmp_path):
-    """Create a Psalms83Scraper instance with temporary data directory."""
+    """
+    Create a Psalms83Scraper instance with its own temporary data directory.
+    
+    Tests write into the directory, so it is never shared between tests.
+    """
     return Psalms83Scraper(data_dir=str(tmp_path))
 
 
@@ -51,29 +102,34 @@ def psalms_scraper_real():
     return Psalms83Scraper(data_dir="data")
 
 
-def check_network_available(host: str = "www.jw.org", port: int = 443, timeout: int = 3) -> bool:
-    """
-    Check if network is available by attempting to connect to a host.
-    
-    Args:
-        host: Hostname to check
-        port: Port to connect to
-        timeout: Connection timeout in seconds
-        
-    Returns:
-        True if connection successful, False otherwise
-    """
+# Host and port the network fixtures connect to
+JW_ORG = ("www.jw.org", 443)
+
+
+async def _probe(host: str, port: int, timeout: float) -> bool:
+    """Try to open a TCP connection to host:port within timeout seconds."""
     try:
-        socket.create_connection((host, port), timeout=timeout)
-        return True
-    except (socket.timeout, socket.error, OSError):
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (asyncio.TimeoutError, OSError):
         return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
 
 
-@pytest.fixture
-def network_available():
+@pytest.fixture(scope="session")
+def jw_org_available():
+    """Check if JW.org specifically is accessible (probed once per session)."""
+    return asyncio.run(_probe(*JW_ORG, timeout=5))
+
+
+@pytest.fixture(scope="session")
+def network_available(jw_org_available):
     """Check if network is available for integration tests."""
-    return check_network_available()
+    return jw_org_available
 
 
 @pytest.fixture
@@ -83,12 +139,6 @@ def skip_if_no_network(network_available):
         pytest.skip("Network not available - skipping integration test")
 
 
-@pytest.fixture
-def jw_org_available():
-    """Check if JW.org specifically is accessible."""
-    return check_network_available("www.jw.org", 443, timeout=5)
-
-
 @pytest.fixture
 def skip_if_jw_org_blocked(jw_org_available):
     """Skip test if JW.org is blocked or unavailable."""
@@ -96,6 +146,46 @@ def skip_if_jw_org_blocked(jw_org_available):
         pytest.skip("JW.org not accessible - may be blocked or down")
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser():
+    """
+    Launch one headless Chromium for the whole test session.
+    
+    Uses Playwright's async API on the session event loop; tests and
+    fixtures driving it must use loop_scope="session" as well. Skips when
+    the playwright package is not installed, as in environments that only
+    drive Playwright through the MCP tools.
+    """
+    async_api = pytest.importorskip(
+        "playwright.async_api", reason="Requires the playwright package (MCP-only environments skip)"
+    )
+    async with async_api.async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        yield browser
+        await browser.close()
+
+
+@pytest.fixture(scope="session")
+def screenshot_digests(request):
+    """
+    SHA-256 digests of stored screenshots, kept in the pytest cache.
+    
+    Lets write_bytes_if_changed() skip rewriting screenshots that are
+    identical to the previous run's.
+    """
+    digests = request.config.cache.get("screenshots/digests", {})
+    yield digests
+    request.config.cache.set("screenshots/digests", digests)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(browser):
+    """Fresh browser context and page per test, so no cookies or storage are shared."""
+    context = await browser.new_context()
+    yield await context.new_page()
+    await context.close()
+
+
 @pytest.fixture
 def sample_verse_html():
     """Sample HTML for a single verse (for unit testing parsers)."""
@@ -204,6 +294,34 @@ def mock_playwright_html():
     """
 
 
+def pytest_addoption(parser):
+    """Add the --runslow option."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked slow (PDF rendering); skipped by default"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Reject duplicate test IDs and skip tests marked slow unless --runslow is given.
+    
+    A test collected twice (e.g. a module copied under another path with the
+    same package name, or --keep-duplicates) would otherwise run twice.
+    """
+    counts = Counter(item.nodeid for item in items)
+    duplicates = sorted(nodeid for nodeid, count in counts.items() if count > 1)
+    if duplicates:
+        raise pytest.UsageError("Tests collected more than once: " + ", ".join(duplicates))
+    
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="Slow test - run with --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 # Marker helpers for better test categorization
 def pytest_configure(config):
     """Register custom markers."""
@@ -216,3 +334,8 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "playwright: mark test as using Playwright browser automation"
     )
+    if not config.pluginmanager.hasplugin("xdist"):
+        # Registered by pytest-xdist when installed; keeps --strict-markers happy without it
+        config.addinivalue_line(
+            "markers", "xdist_group(name): run tests sharing a group on one xdist worker"
+        )
@@ -2,7 +2,8 @@
 """
 Test script to verify Psalms 83 scraper captures all data components.
 """
-import json
+import contextlib
+import io
 import sys
 from pathlib import Path
 
@@ -11,6 +12,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.scrapers.psalms_scraper import Psalms83Scraper
+from src.utils.storage import DataStorage
 
 # Simple validator functions
 def validate_chapter_completeness(data):
@@ -25,8 +27,11 @@ def validate_psalms_83_specific(data):
     """Check Psalms 83 specific content."""
     checks = {}
     
+    # Index verses once; numbers may be parsed as int or str
+    verses_by_number = {str(v.get('number')): v for v in data.get('verses', [])}
+    
     # Check for "Jehovah" in verse 18
-    verse_18 = next((v for v in data.get('verses', []) if v.get('number') == '18'), None)
+    verse_18 = verses_by_number.get('18')
     checks['Has "Jehovah" in verse 18'] = verse_18 and 'Jehovah' in verse_18.get('text', '') if verse_18 else False
     
     # Check for superscription
@@ -34,7 +39,7 @@ def validate_psalms_83_specific(data):
     checks['Superscription mentions Asaph'] = 'Aʹsaph' in data.get('superscription', '') if data.get('superscription') else False
     
     # Check for "Selah"
-    verse_8 = next((v for v in data.get('verses', []) if v.get('number') == '8'), None)
+    verse_8 = verses_by_number.get('8')
     checks['Has "Selah" in verse 8'] = verse_8 and 'Selah' in verse_8.get('text', '') if verse_8 else False
     
     return checks
@@ -63,8 +68,8 @@ def print_section(title: str, data: any, indent: int = 0):
         print(f"{prefix}{data}")
 
 
-def main():
-    """Test Psalms 83 extraction with live HTML."""
+def run_extraction_report():
+    """Parse the live Psalms 83 HTML and print the extraction report."""
     
     # Read the HTML file that was saved from Playwright
     html_file = project_root / 'data' / 'samples' / 'psalms_83_live.html'
@@ -168,17 +173,25 @@ def main():
     print(f"✅ Study notes: {len(study_notes)}")
     print(f"✅ Superscription: {'Yes' if data.get('superscription') else 'No'}")
     
-    # Save results
-    output_file = project_root / 'data' / 'processed' / 'psalms_83_live_test.json'
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Save results (DataStorage writes with orjson when it is installed)
+    storage = DataStorage(base_dir=str(project_root / 'data'))
+    output_file = storage.save_json(data, 'psalms_83_live_test.json', processed=True)
     
     print(f"\n💾 Full results saved to: {output_file}")
     
     return 0
 
 
+def main():
+    """Test Psalms 83 extraction with live HTML."""
+    # Collect the report in memory and write it to stdout in one call
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out):
+            return run_extraction_report()
+    finally:
+        sys.stdout.write(out.getvalue())
+
+
 if __name__ == '__main__':
     sys.exit(main())
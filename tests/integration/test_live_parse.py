@@ -10,7 +10,6 @@ sys.path.insert(0, str(project_root))
 
 from src.scrapers.psalms_scraper import Psalms83Scraper
 from src.utils.validators import validate_chapter_completeness, validate_psalms_83_specific
-import json
 
 # Read the HTML from the live extraction
 html_content = """[HTML content will be pasted here]"""
@@ -62,8 +61,6 @@ if len(data.get('verses', [])) >= 18:
     print(f"  Number: {data['verses'][17].get('number')}")
     print(f"  Text: {data['verses'][17].get('text')}")
 
-# Save to file
-output_file = 'data/processed/live_test_psalms_83.json'
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(data, f, indent=2, ensure_ascii=False)
+# Save to file (written with orjson when it is installed)
+output_file = scraper.save_chapter_data(data, 'live_test_psalms_83.json')
 print(f"\nSaved results to: {output_file}")
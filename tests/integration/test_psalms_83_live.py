@@ -9,35 +9,98 @@ blocked or unavailable. Run with: pytest tests/integration -m integration -v
 """
 
 import pytest
-import time
+import pytest_asyncio
 from typing import Dict, Any
 
 from src.scrapers.psalms_scraper import Psalms83Scraper
+from src.utils.storage import read_json, write_bytes_if_changed
+
+
+PSALMS_83_URL = "https://www.jw.org/en/library/bible/study-bible/books/psalms/83/"
+
+
+async def get_page_html(page) -> str:
+    """
+    Return the page's HTML in a single DevTools round-trip.
+    
+    Uses a CDP session's ``Runtime.evaluate`` on Chromium, which skips the
+    navigation synchronization behind ``page.content()``; falls back to
+    ``page.content()`` for browsers without CDP.
+    
+    Args:
+        page: Playwright page
+        
+    Returns:
+        The document's outer HTML
+    """
+    try:
+        cdp = await page.context.new_cdp_session(page)
+    except Exception:
+        return await page.content()
+    try:
+        result = await cdp.send(
+            "Runtime.evaluate",
+            {"expression": "document.documentElement.outerHTML", "returnByValue": True}
+        )
+        return result["result"]["value"]
+    finally:
+        await cdp.detach()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def psalms_83_live_page(jw_org_available, browser, screenshot_digests, request):
+    """
+    Load the live Psalms 83 page once for the whole module.
+    
+    Uses a context of the session-wide browser, and navigation waits for
+    the network to go idle in the same call, so the page is fetched once
+    rather than once per test.
+    
+    Returns:
+        Tuple of (page title, page HTML)
+    """
+    if not jw_org_available:
+        pytest.skip("JW.org not accessible - may be blocked or down")
+    
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        await page.goto(PSALMS_83_URL, wait_until="networkidle")
+        
+        # Raw PNG, stored only when the page looks different from the last run
+        screenshot_dir = request.config.cache.mkdir("screenshots")
+        write_bytes_if_changed(
+            str(screenshot_dir / "psalms_83_integration_test.png"),
+            await page.screenshot(full_page=True, type="png"),
+            screenshot_digests
+        )
+        return await page.title(), await get_page_html(page)
+    finally:
+        await context.close()
+
+
+@pytest.fixture(scope="module")
+def psalms_83_live(psalms_83_live_page):
+    """Parse the live Psalms 83 page once for the whole module."""
+    _, html = psalms_83_live_page
+    return Psalms83Scraper(data_dir="data").parse_html_content(html)
 
 
 @pytest.mark.integration
 @pytest.mark.jw_org
 @pytest.mark.playwright
+@pytest.mark.xdist_group("network")
+@pytest.mark.usefixtures("skip_if_jw_org_blocked")
 class TestPsalms83LiveScraping:
     """
     Real-world integration tests for Psalms 83 scraping.
     
     These tests interact with the live JW.org website and verify that
-    the complete scraping workflow works end-to-end.
+    the complete scraping workflow works end-to-end. They share a single
+    page load through the psalms_83_live fixtures.
     """
     
-    PSALMS_83_URL = "https://www.jw.org/en/library/bible/study-bible/books/psalms/83/"
-    
-    @pytest.fixture(autouse=True)
-    def setup_method(self, skip_if_jw_org_blocked):
-        """Setup for each test - ensures JW.org is accessible."""
-        # The skip_if_jw_org_blocked fixture will skip if site is down
-        pass
-    
-    @pytest.fixture
-    def scraper(self):
-        """Create scraper instance for tests."""
-        return Psalms83Scraper(data_dir="data")
+    PSALMS_83_URL = PSALMS_83_URL
     
     def test_psalms_83_url_accessible(self, jw_org_available):
         """
@@ -46,32 +109,16 @@ class TestPsalms83LiveScraping:
         This is a basic connectivity test before attempting full scraping.
         """
         assert jw_org_available, "JW.org should be accessible for integration tests"
-        
-        # Note: In a real scenario with Playwright MCP, we would:
-        # playwright-browser_navigate(url=self.PSALMS_83_URL)
-        # result = playwright-browser_wait_for(text="Psalm 83", time=5)
-        # assert result indicates page loaded
     
-    @pytest.mark.skip(reason="Requires Playwright MCP tools - manual test only")
-    def test_navigate_to_psalms_83(self, scraper):
-        """
-        Test navigation to Psalms 83 page using Playwright.
+    def test_navigate_to_psalms_83(self, psalms_83_live_page):
+        """Test that navigation reached the Psalms 83 page."""
+        title, html = psalms_83_live_page
         
-        Workflow:
-        1. Navigate to URL
-        2. Wait for page load
-        3. Verify page title/content
-        """
-        # This would use Playwright MCP tools:
-        # playwright-browser_navigate(url=self.PSALMS_83_URL)
-        # playwright-browser_wait_for(text="Psalm 83", time=5)
-        # title = playwright-browser_evaluate("() => document.title")
-        # assert "Psalm 83" in title
-        
-        pytest.skip("Requires manual Playwright MCP execution")
+        assert "Psalm" in title
+        assert "83" in title
+        assert html
     
-    @pytest.mark.skip(reason="Requires Playwright MCP tools - manual test only")
-    def test_extract_all_18_verses(self, scraper):
+    def test_extract_all_18_verses(self, psalms_83_live):
         """
         Test extraction of all 18 verses from Psalms 83.
         
@@ -82,29 +129,15 @@ class TestPsalms83LiveScraping:
         - Verse 1 starts with "O God"
         - Verse 18 contains "Jehovah" and "Most High"
         """
-        # Workflow:
-        # 1. Navigate and wait
-        # playwright-browser_navigate(url=self.PSALMS_83_URL)
-        # playwright-browser_wait_for(text="Psalm 83", time=5)
-        
-        # 2. Extract HTML
-        # html = playwright-browser_evaluate("() => document.body.innerHTML")
-        
-        # 3. Parse with scraper
-        # data = scraper.parse_html_content(html)
-        
-        # 4. Assertions
-        # assert len(data['verses']) == 18
-        # assert data['verses'][0]['number'] == 1
-        # assert "O God" in data['verses'][0]['text']
-        # assert data['verses'][17]['number'] == 18
-        # assert "Jehovah" in data['verses'][17]['text']
-        # assert "Most High" in data['verses'][17]['text']
+        verses = psalms_83_live['verses']
         
-        pytest.skip("Requires manual Playwright MCP execution")
+        assert [verse['number'] for verse in verses] == list(range(1, 19))
+        assert all(verse['text'] for verse in verses)
+        assert "O God" in verses[0]['text']
+        assert "Jehovah" in verses[17]['text']
+        assert "Most High" in verses[17]['text']
     
-    @pytest.mark.skip(reason="Requires Playwright MCP tools - manual test only")
-    def test_extract_superscription(self, scraper):
+    def test_extract_superscription(self, psalms_83_live):
         """
         Test extraction of the psalm superscription.
         
@@ -113,37 +146,27 @@ class TestPsalms83LiveScraping:
         - Contains "Asaph"
         - Mentions "melody" or "song"
         """
-        # Similar workflow as above
-        # data = scraper.parse_html_content(html)
-        # assert data['superscription'] is not None
-        # assert "Asaph" in data['superscription']
+        superscription = psalms_83_live['superscription']
         
-        pytest.skip("Requires manual Playwright MCP execution")
+        assert superscription is not None
+        assert "saph" in superscription  # Rendered as "Aʹsaph" on the site
+        assert "melody" in superscription or "song" in superscription
     
-    @pytest.mark.skip(reason="Requires Playwright MCP tools - manual test only")
-    def test_extract_study_notes(self, scraper):
+    def test_extract_study_notes(self, psalms_83_live):
         """
         Test extraction of study notes.
         
         Expected:
         - At least 5 study notes
         - Each note has: id, reference, content
-        - Note on verse 18 mentions "Jehovah" or divine name
         """
-        # data = scraper.parse_html_content(html)
-        # notes = data['study_notes']
-        # assert len(notes) >= 5
-        # 
-        # for note in notes:
-        #     assert 'id' in note
-        #     assert 'reference' in note
-        #     assert 'content' in note
-        #     assert len(note['content']) > 10
+        notes = psalms_83_live['study_notes']
+        required = {'id', 'reference', 'content'}
         
-        pytest.skip("Requires manual Playwright MCP execution")
+        assert len(notes) >= 5
+        assert [note for note in notes if not required <= note.keys() or len(note['content']) <= 10] == []
     
-    @pytest.mark.skip(reason="Requires Playwright MCP tools - manual test only")
-    def test_extract_footnotes(self, scraper):
+    def test_extract_footnotes(self, psalms_83_live):
         """
         Test extraction of footnotes.
         
@@ -151,43 +174,25 @@ class TestPsalms83LiveScraping:
         - At least 1 footnote (Selah)
         - Selah footnote explains the term
         """
-        # data = scraper.parse_html_content(html)
-        # footnotes = data['footnotes']
-        # assert len(footnotes) >= 1
-        # 
-        # # Check for Selah footnote
-        # selah_found = False
-        # for fn in footnotes:
-        #     if 'Selah' in fn.get('content', ''):
-        #         selah_found = True
-        #         break
-        # assert selah_found, "Selah footnote should be present"
+        footnotes = psalms_83_live['footnotes']
         
-        pytest.skip("Requires manual Playwright MCP execution")
+        assert len(footnotes) >= 1
+        assert any('Selah' in fn.get('content', '') for fn in footnotes), "Selah footnote should be present"
     
-    @pytest.mark.skip(reason="Requires Playwright MCP tools - manual test only")
-    def test_extract_cross_references(self, scraper):
+    def test_extract_cross_references(self, psalms_83_live):
         """
         Test extraction of cross-references.
         
         Expected:
         - At least 1 cross-reference
         - Cross-references have verse lists
-        - References to Judges, Genesis mentioned
         """
-        # data = scraper.parse_html_content(html)
-        # xrefs = data['cross_references']
-        # assert len(xrefs) > 0
-        # 
-        # for xref in xrefs:
-        #     assert 'id' in xref
-        #     assert 'verses' in xref
-        #     assert isinstance(xref['verses'], list)
+        xrefs = psalms_83_live['cross_references']
         
-        pytest.skip("Requires manual Playwright MCP execution")
+        assert len(xrefs) > 0
+        assert all('id' in xref and isinstance(xref.get('verses'), list) for xref in xrefs)
     
-    @pytest.mark.skip(reason="Requires Playwright MCP tools - manual test only")
-    def test_verse_18_contains_jehovah(self, scraper):
+    def test_verse_18_contains_jehovah(self, psalms_83_live):
         """
         Specific test for the famous verse 18.
         
@@ -196,72 +201,35 @@ class TestPsalms83LiveScraping:
         - "Most High"
         - "over all the earth"
         """
-        # data = scraper.parse_html_content(html)
-        # verse_18 = data['verses'][17]  # 0-indexed
-        # 
-        # assert verse_18['number'] == 18
-        # assert 'Jehovah' in verse_18['text']
-        # assert 'Most High' in verse_18['text']
-        # assert 'earth' in verse_18['text'].lower()
+        verse_18 = psalms_83_live['verses'][17]  # 0-indexed
         
-        pytest.skip("Requires manual Playwright MCP execution")
+        assert verse_18['number'] == 18
+        assert 'Jehovah' in verse_18['text']
+        assert 'Most High' in verse_18['text']
+        assert 'earth' in verse_18['text'].lower()
     
-    @pytest.mark.skip(reason="Requires Playwright MCP tools - manual test only")
-    def test_complete_scrape_workflow(self, scraper):
+    def test_complete_scrape_workflow(self, psalms_83_live, tmp_path):
         """
-        End-to-end integration test of the complete scraping workflow.
+        End-to-end check of the scraped data: structure, saving and reloading.
         
-        This test validates the entire process from navigation to data storage.
-        
-        Steps:
-        1. Navigate to Psalms 83
-        2. Wait for content to load
-        3. Take screenshot for debugging
-        4. Extract HTML
-        5. Parse with BeautifulSoup
-        6. Validate data structure
-        7. Save to file
-        8. Verify saved data
+        Navigation, waiting and parsing happen once in the module fixtures;
+        this test validates the result and round-trips it through storage.
         """
-        # Step 1: Navigate
-        # playwright-browser_navigate(url=self.PSALMS_83_URL)
-        
-        # Step 2: Wait for dynamic content
-        # time.sleep(3)  # Respect rate limiting
-        # playwright-browser_wait_for(text="Psalm 83", time=5)
-        
-        # Step 3: Screenshot for debugging
-        # playwright-browser_take_screenshot(
-        #     filename="psalms_83_integration_test.jpeg",
-        #     fullPage=True,
-        #     type="jpeg"
-        # )
-        
-        # Step 4: Extract HTML
-        # html = playwright-browser_evaluate("() => document.body.innerHTML")
+        data = psalms_83_live
         
-        # Step 5: Parse
-        # data = scraper.parse_html_content(html)
+        assert data['book'] == 'Psalms'
+        assert data['chapter'] == 83
+        assert len(data['verses']) == 18
+        assert len(data['study_notes']) >= 5
+        assert len(data['footnotes']) >= 1
+        assert data['metadata']['has_superscription'] is True
         
-        # Step 6: Validate structure
-        # assert data['book'] == 'Psalms'
-        # assert data['chapter'] == 83
-        # assert len(data['verses']) == 18
-        # assert len(data['study_notes']) >= 5
-        # assert len(data['footnotes']) >= 1
-        # assert data['metadata']['has_superscription'] is True
+        scraper = Psalms83Scraper(data_dir=str(tmp_path))
+        filepath = scraper.save_chapter_data(data, "integration_test_psalms_83.json")
         
-        # Step 7: Save to file
-        # filepath = scraper.save_chapter_data(data, "integration_test_psalms_83.json")
-        # assert os.path.exists(filepath)
-        
-        # Step 8: Verify saved data can be reloaded
-        # with open(filepath, 'r', encoding='utf-8') as f:
-        #     reloaded = json.load(f)
-        # assert reloaded['chapter'] == 83
-        # assert len(reloaded['verses']) == 18
-        
-        pytest.skip("Requires manual Playwright MCP execution")
+        reloaded = read_json(filepath)
+        assert reloaded['chapter'] == 83
+        assert len(reloaded['verses']) == 18
 
 
 @pytest.mark.integration
@@ -282,10 +250,8 @@ class TestPsalms83DataValidation:
         """Verify verse numbers are sequential 1-18."""
         verses = psalms_83_sample['verses']
         
-        for i, verse in enumerate(verses):
-            expected_num = i + 1
-            assert verse['number'] == expected_num, \
-                f"Verse at index {i} should be number {expected_num}, got {verse['number']}"
+        # One list comparison; pytest reports the first differing index
+        assert [verse['number'] for verse in verses] == list(range(1, len(verses) + 1))
     
     def test_sample_verse_18_content(self, psalms_83_sample, expected_psalms_83_structure):
         """Verify verse 18 contains expected key content."""
@@ -305,11 +271,11 @@ class TestPsalms83DataValidation:
     
     def test_sample_study_notes_structure(self, psalms_83_sample):
         """Verify each study note has required fields."""
-        for note in psalms_83_sample['study_notes']:
-            assert 'id' in note, "Study note missing 'id'"
-            assert 'reference' in note, "Study note missing 'reference'"
-            assert 'content' in note, "Study note missing 'content'"
-            assert len(note['content']) > 0, "Study note content is empty"
+        required = {'id', 'reference', 'content'}
+        
+        invalid = [note for note in psalms_83_sample['study_notes']
+                   if not required <= note.keys() or not note['content']]
+        assert invalid == [], "Study notes missing fields or content"
 
 
 @pytest.mark.integration
@@ -320,24 +286,18 @@ class TestPsalms83Comparison:
     These help identify when JW.org updates their content.
     """
     
-    @pytest.mark.skip(reason="Requires live scraping - manual execution only")
-    def test_live_vs_sample_verse_count(self, scraper, psalms_83_sample):
+    def test_live_vs_sample_verse_count(self, psalms_83_live, psalms_83_sample):
         """Compare verse count between live and sample data."""
-        # live_data = scraper.scrape_chapter()  # Would need to implement
-        # assert len(live_data['verses']) == len(psalms_83_sample['verses'])
-        pytest.skip("Requires live scraping capability")
+        assert len(psalms_83_live['verses']) == len(psalms_83_sample['verses'])
     
-    @pytest.mark.skip(reason="Requires live scraping - manual execution only")
-    def test_live_vs_sample_verse_18_text(self, scraper, psalms_83_sample):
+    def test_live_vs_sample_verse_18_text(self, psalms_83_live, psalms_83_sample):
         """Compare verse 18 text between live and sample."""
-        # live_data = scraper.scrape_chapter()
-        # live_v18 = live_data['verses'][17]['text']
-        # sample_v18 = psalms_83_sample['verses'][17]['text']
-        # 
-        # # Allow for minor formatting differences
-        # assert live_v18.strip() == sample_v18.strip() or \
-        #        'Jehovah' in live_v18 and 'Most High' in live_v18
-        pytest.skip("Requires live scraping capability")
+        live_v18 = psalms_83_live['verses'][17]['text']
+        sample_v18 = psalms_83_sample['verses'][17]['text']
+        
+        # Allow for minor formatting differences
+        assert live_v18.strip() == sample_v18.strip() or \
+               'Jehovah' in live_v18 and 'Most High' in live_v18
 
 
 def test_integration_test_can_import():
@@ -0,0 +1,112 @@
+"""
+Tests for the Selenium-based Bible scraper.
+
+These tests use a mocked WebDriver so no browser is launched.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.scrapers import bible_scraper
+from src.scrapers.bible_scraper import (
+    BibleScraper,
+    ChapterData,
+    BOOKS_LIST_SCRIPT,
+    CHAPTER_VERSES_SCRIPT,
+    close_shared_driver,
+    shared_driver,
+)
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    """Create a scraper with a mocked WebDriver."""
+    scraper = BibleScraper(headless=True, wait_time=1, cache_dir=str(tmp_path))
+    scraper.driver = MagicMock()
+    with patch('src.scrapers.bible_scraper.time.sleep'):
+        yield scraper
+
+
+class TestBibleScraper:
+    """Tests for BibleScraper extraction."""
+
+    def test_get_books_list_uses_single_script(self, scraper):
+        """Test that books are extracted in one execute_script round-trip."""
+        scraper.driver.execute_script.return_value = [
+            {'name': 'Genesis', 'url': '/genesis', 'has_study_notes': True},
+            {'name': 'Exodus', 'url': '/exodus', 'has_study_notes': False},
+        ]
+
+        books = scraper.get_books_list()
+
+        scraper.driver.execute_script.assert_called_once_with(BOOKS_LIST_SCRIPT)
+        assert [b['name'] for b in books] == ['Genesis', 'Exodus']
+        assert books[0]['has_study_notes'] is True
+
+    def test_get_books_list_cached_on_disk(self, scraper, tmp_path):
+        """Test that a cached books list is returned without the WebDriver."""
+        scraper.driver.execute_script.return_value = [
+            {'name': 'Genesis', 'url': '/genesis', 'has_study_notes': True},
+        ]
+        scraper.get_books_list()
+
+        fresh = BibleScraper(cache_dir=str(tmp_path))
+        with patch.object(BibleScraper, 'setup_driver') as mock_setup:
+            books = fresh.get_books_list()
+
+        mock_setup.assert_not_called()
+        assert books == [{'name': 'Genesis', 'url': '/genesis', 'has_study_notes': True}]
+
+    def test_get_chapter_content_uses_single_script(self, scraper):
+        """Test that verses are extracted in one execute_script round-trip."""
+        scraper.driver.execute_script.return_value = [
+            {'number': '1', 'text': '1In the beginning God created the heavens and the earth.'},
+            {'number': None, 'text': '3 Heading without a verse number'},
+            {'number': ' 2 ', 'text': '2 Now the earth was formless and desolate.\n'},
+        ]
+
+        data = scraper.get_chapter_content('/genesis', 1)
+
+        scraper.driver.execute_script.assert_called_once_with(CHAPTER_VERSES_SCRIPT)
+        scraper.driver.get.assert_called_once_with(
+            "https://www.jw.org/en/library/bible/study-bible/books/genesis/1/"
+        )
+        assert isinstance(data, ChapterData)
+        assert data.chapter == 1
+        assert [v['number'] for v in data.verses] == ['1', '2']
+        assert data.verses[1]['text'] == '2 Now the earth was formless and desolate.'
+        assert data.to_dict()['study_notes'] == []
+
+
+class TestDriverLifecycle:
+    """Tests for WebDriver session management."""
+
+    def test_context_manager_opens_and_closes_driver(self):
+        """Test that the context manager owns one driver per session."""
+        with patch('src.scrapers.bible_scraper.create_driver') as mock_create:
+            with BibleScraper(cache_dir=None) as scraper:
+                driver = scraper.driver
+                assert driver is mock_create.return_value
+
+        mock_create.assert_called_once()
+        driver.quit.assert_called_once()
+        assert scraper.driver is None
+
+    def test_shared_driver_reused_across_scrapers(self):
+        """Test that the shared driver is launched once and not quit by scrapers."""
+        with patch('src.scrapers.bible_scraper.create_driver') as mock_create:
+            try:
+                with shared_driver() as first:
+                    with BibleScraper(driver=first, cache_dir=None):
+                        pass
+                with shared_driver() as second:
+                    pass
+
+                assert first is second
+                mock_create.assert_called_once()
+                first.quit.assert_not_called()
+            finally:
+                close_shared_driver()
+
+        first.quit.assert_called_once()
+        assert bible_scraper._shared_driver is None
@@ -8,19 +8,19 @@ import pytest
 import json
 import sys
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import the functions we want to test
 from scripts.generate_print import discover_chapters, generate_chapter, load_chapter_data
+from src.utils.storage import read_json
 
 
 class TestDiscoverChapters:
     """Tests for chapter discovery functionality."""
     
-    def test_discover_chapters_from_samples(self, tmp_path, monkeypatch):
+    def test_discover_chapters_from_samples(self, tmp_path):
         """Test discovering chapters from samples directory."""
         # Create mock samples directory
         samples_dir = tmp_path / "data" / "samples"
@@ -32,16 +32,7 @@ class TestDiscoverChapters:
         (samples_dir / "psalms_150_sample.json").touch()
         (samples_dir / "genesis_1_sample.json").touch()  # Different book
         
-        # Mock the base directory
-        with patch('scripts.generate_print.Path') as mock_path:
-            mock_path.return_value.parent.parent = tmp_path
-            
-            # Import after mocking
-            import importlib
-            import scripts.generate_print
-            importlib.reload(scripts.generate_print)
-            
-            chapters = scripts.generate_print.discover_chapters("Psalms")
+        chapters = discover_chapters("Psalms", base_dir=tmp_path)
         
         # Should find 3 Psalms chapters
         assert len(chapters) == 3
@@ -49,7 +40,7 @@ class TestDiscoverChapters:
         assert 83 in chapters
         assert 150 in chapters
     
-    def test_discover_chapters_from_processed(self, tmp_path, monkeypatch):
+    def test_discover_chapters_from_processed(self, tmp_path):
         """Test discovering chapters from processed directory."""
         # Create mock processed directory
         processed_dir = tmp_path / "data" / "processed" / "Genesis"
@@ -60,15 +51,7 @@ class TestDiscoverChapters:
         (processed_dir / "chapter_2.json").touch()
         (processed_dir / "chapter_50.json").touch()
         
-        # Mock the base directory
-        with patch('scripts.generate_print.Path') as mock_path:
-            mock_path.return_value.parent.parent = tmp_path
-            
-            import importlib
-            import scripts.generate_print
-            importlib.reload(scripts.generate_print)
-            
-            chapters = scripts.generate_print.discover_chapters("Genesis")
+        chapters = discover_chapters("Genesis", base_dir=tmp_path)
         
         assert len(chapters) == 3
         assert 1 in chapters
@@ -77,14 +60,7 @@ class TestDiscoverChapters:
     
     def test_discover_chapters_empty(self, tmp_path):
         """Test discovering chapters when no files exist."""
-        with patch('scripts.generate_print.Path') as mock_path:
-            mock_path.return_value.parent.parent = tmp_path
-            
-            import importlib
-            import scripts.generate_print
-            importlib.reload(scripts.generate_print)
-            
-            chapters = scripts.generate_print.discover_chapters("NonExistent")
+        chapters = discover_chapters("NonExistent", base_dir=tmp_path)
         
         assert len(chapters) == 0
 
@@ -92,33 +68,19 @@ class TestDiscoverChapters:
 class TestGenerateChapter:
     """Tests for chapter generation functionality."""
     
-    def test_generate_chapter_success(self, tmp_path, psalms_83_sample):
+    def test_generate_chapter_success(self, tmp_path, psalms_83_sample, shared_formatter):
         """Test successful chapter generation."""
-        # Save sample data to temp file
-        data_dir = tmp_path / "data" / "samples"
-        data_dir.mkdir(parents=True)
-        sample_file = data_dir / "psalms_83_sample.json"
-        
-        with open(sample_file, 'w') as f:
-            json.dump(psalms_83_sample, f)
+        output_dir = tmp_path / "output"
         
-        # Mock load_chapter_data to use our temp file
-        with patch('scripts.generate_print.load_chapter_data') as mock_load:
-            mock_load.return_value = psalms_83_sample
-            
-            from scripts.generate_print import generate_chapter
-            from src.formatters.study_print_formatter import StudyBiblePrintFormatter
-            
-            formatter = StudyBiblePrintFormatter()
-            output_dir = tmp_path / "output"
-            
-            result = generate_chapter(
-                "Psalms",
-                83,
-                "html",
-                output_dir,
-                formatter
-            )
+        # Chapter data is passed in memory; loading is covered by TestLoadChapterData
+        result = generate_chapter(
+            "Psalms",
+            83,
+            "html",
+            output_dir,
+            shared_formatter,
+            data=psalms_83_sample
+        )
         
         assert result['success'] is True
         assert result['book'] == "Psalms"
@@ -126,12 +88,8 @@ class TestGenerateChapter:
         assert len(result['files']) == 1
         assert 'chapter_83.html' in result['files'][0]
     
-    def test_generate_chapter_missing_data(self, tmp_path):
+    def test_generate_chapter_missing_data(self, tmp_path, shared_formatter):
         """Test chapter generation with missing data."""
-        from scripts.generate_print import generate_chapter
-        from src.formatters.study_print_formatter import StudyBiblePrintFormatter
-        
-        formatter = StudyBiblePrintFormatter()
         output_dir = tmp_path / "output"
         
         result = generate_chapter(
@@ -139,7 +97,8 @@ class TestGenerateChapter:
             999,
             "pdf",
             output_dir,
-            formatter
+            shared_formatter,
+            base_dir=tmp_path
         )
         
         assert result['success'] is False
@@ -150,45 +109,22 @@ class TestGenerateChapter:
 class TestLoadChapterData:
     """Tests for chapter data loading."""
     
-    def test_load_chapter_data_from_samples(self, tmp_path, psalms_83_sample):
+    def test_load_chapter_data_from_samples(self, tmp_path, psalms_83_sample_bytes):
         """Test loading chapter data from samples directory."""
         # Create samples directory and file
         samples_dir = tmp_path / "data" / "samples"
         samples_dir.mkdir(parents=True)
-        sample_file = samples_dir / "psalms_83_sample.json"
+        (samples_dir / "psalms_83_sample.json").write_bytes(psalms_83_sample_bytes)
         
-        with open(sample_file, 'w') as f:
-            json.dump(psalms_83_sample, f)
-        
-        # Mock the base directory
-        with patch('scripts.generate_print.Path') as mock_path:
-            # Make __file__.parent.parent return tmp_path
-            mock_file = MagicMock()
-            mock_file.parent.parent = tmp_path
-            mock_path.return_value = mock_file
-            
-            import importlib
-            import scripts.generate_print
-            importlib.reload(scripts.generate_print)
-            
-            data = scripts.generate_print.load_chapter_data("Psalms", 83)
+        data = load_chapter_data("Psalms", 83, base_dir=tmp_path)
         
         assert data['book'] == "Psalms"
         assert data['chapter'] == 83
     
     def test_load_chapter_data_not_found(self, tmp_path):
         """Test loading non-existent chapter data."""
-        with patch('scripts.generate_print.Path') as mock_path:
-            mock_file = MagicMock()
-            mock_file.parent.parent = tmp_path
-            mock_path.return_value = mock_file
-            
-            import importlib
-            import scripts.generate_print
-            importlib.reload(scripts.generate_print)
-            
-            with pytest.raises(FileNotFoundError):
-                scripts.generate_print.load_chapter_data("NonExistent", 999)
+        with pytest.raises(FileNotFoundError):
+            load_chapter_data("NonExistent", 999, base_dir=tmp_path)
 
 
 @pytest.mark.integration
@@ -214,19 +150,12 @@ class TestBatchProcessingIntegration:
             with open(processed_dir / f"chapter_{chapter}.json", 'w') as f:
                 json.dump(chapter_data, f)
         
-        # Mock the base directory
-        with patch('scripts.generate_print.Path') as mock_path:
-            mock_file = MagicMock()
-            mock_file.parent.parent = tmp_path
-            mock_path.return_value = mock_file
-            mock_path.side_effect = lambda x: Path(x)  # For other Path calls
-            
-            import importlib
-            import scripts.generate_print
-            importlib.reload(scripts.generate_print)
-            
-            # Discover chapters
-            chapters = scripts.generate_print.discover_chapters("TestBook")
+        # Discover chapters
+        chapters = discover_chapters("TestBook", base_dir=tmp_path)
         
         assert len(chapters) == 3
         assert set(chapters) == {1, 2, 3}
+        
+        chapter_2 = read_json(processed_dir / "chapter_2.json")
+        assert chapter_2["chapter"] == 2
+        assert chapter_2["verses"][0]["text"] == "Chapter 2 verse 1"
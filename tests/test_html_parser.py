@@ -0,0 +1,42 @@
+"""
+Tests for the generic Study Bible HTML parser.
+"""
+
+from src.parsers.html_parser import HTML_PARSER, StudyBibleParser
+
+SAMPLE_HTML = """
+<html><body>
+<h1 class="bookName">Psalms</h1><span class="chapterNumber">83</span>
+<p class="verse"><span class="v">1</span>O God, do not keep silent;<a class="footnoteLink" data-footnote="fn1">*</a></p>
+<p class="verse"><span class="v">2</span>For look! your enemies are in an uproar;<a class="b" data-reflink="x1">+</a></p>
+<div class="studyNote" id="sn1"><span class="reference">83:1</span><div class="content">A note.</div></div>
+<div class="footnote" id="fn1">Or "Selah."</div>
+<div class="crossReference" id="x1"><a class="verseLink">Ps 28:1</a><a class="verseLink">Ps 35:22</a></div>
+</body></html>
+"""
+
+
+def test_parse_all():
+    """Test that every section is extracted from a small page."""
+    data = StudyBibleParser(SAMPLE_HTML).parse_all()
+
+    assert data['chapter_info'] == {'book': 'Psalms', 'chapter': '83'}
+    assert [(v['number'], v['text']) for v in data['verses']] == [
+        ('1', 'O God, do not keep silent;*'),
+        ('2', 'For look! your enemies are in an uproar;+'),
+    ]
+    assert data['verses'][0]['footnotes'] == ['fn1']
+    assert data['verses'][1]['cross_references'] == ['x1']
+    assert data['study_notes'] == [{'id': 'sn1', 'reference': '83:1', 'content': 'A note.'}]
+    assert data['footnotes'] == [{'id': 'fn1', 'content': 'Or "Selah."'}]
+    assert data['cross_references'] == [{'id': 'x1', 'verses': ['Ps 28:1', 'Ps 35:22']}]
+
+
+def test_uses_lxml_when_installed():
+    """Test that the parser picks the C-based backend when available."""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        assert HTML_PARSER == 'html.parser'
+    else:
+        assert HTML_PARSER == 'lxml'
@@ -97,28 +97,36 @@ class TestPlaywrightMCPIntegration:
     Playwright MCP server available.
     """
     
-    @pytest.mark.skip(reason="Requires Playwright MCP environment and live site access")
-    def test_live_navigation(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_live_navigation(self, skip_if_jw_org_blocked, page):
         """
         Test navigation to the actual website.
         
-        This test is skipped by default as it requires:
-        1. Playwright MCP tools available
+        This test is skipped unless:
+        1. The playwright package is installed (see the browser fixture)
         2. Network access to jw.org
         3. Site not blocking automated access
         """
-        # Example implementation:
-        # snapshot = await playwright_browser_navigate(url)
-        # assert "Bible" in snapshot or "Study" in snapshot
-        pass
+        from src.scrapers.playwright_scraper import PlaywrightBibleScraper
+        
+        await page.goto(PlaywrightBibleScraper.BASE_URL, wait_until="domcontentloaded")
+        title = await page.title()
+        
+        assert "Bible" in title or "Study" in title
     
-    @pytest.mark.skip(reason="Requires Playwright MCP environment")
-    def test_live_book_extraction(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_live_book_extraction(self, skip_if_jw_org_blocked, page):
         """
         Test extracting books from live site.
         """
-        # Would use actual Playwright MCP tools here
-        pass
+        from src.scrapers.playwright_scraper import PlaywrightBibleScraper
+        
+        await page.goto(PlaywrightBibleScraper.BASE_URL, wait_until="networkidle")
+        book_links = await page.eval_on_selector_all(
+            "a[href*='/study-bible/books/']", "links => new Set(links.map(a => a.pathname)).size"
+        )
+        
+        assert book_links >= 66
 
 
 def test_playwright_scraper_import():
@@ -151,6 +159,20 @@ def test_chapter_instructions():
     assert "genesis/1" in instructions["step_1"]
 
 
+def test_instructions_built_once():
+    """Test that repeated requests share one read-only instructions mapping."""
+    from src.scrapers.playwright_scraper import PlaywrightBibleScraper
+    
+    first, second = PlaywrightBibleScraper(), PlaywrightBibleScraper()
+    
+    assert first.get_books_list_instructions() is second.get_books_list_instructions()
+    assert first.get_chapter_content_instructions("/genesis", 1) is \
+        second.get_chapter_content_instructions("/genesis", 1)
+    assert "genesis/2" in first.get_chapter_content_instructions("/genesis", 2)["step_1"]
+    with pytest.raises(TypeError):
+        first.get_chapter_content_instructions("/genesis", 1)["step_1"] = "changed"
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v"])
@@ -9,27 +9,39 @@ This module tests the Psalms 83 scraping workflow including:
 """
 
 import pytest
+import io
 import json
 import os
+import re
+import shutil
 from typing import Dict, Any
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup, Tag
 
 # Import the scraper
-from src.scrapers.psalms_scraper import Psalms83Scraper
+from src.scrapers import psalms_scraper
+from src.scrapers.psalms_scraper import CONTENT_STRAINER, Psalms83Scraper
+
+# Verse number markup written by format_for_html()
+VERSE_NUM_SPAN_RE = re.compile(r'<span class="verse-num">(\d+)</span>')
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    """Create one scraper instance shared by this module's tests."""
+    return Psalms83Scraper(data_dir="data")
+
+
+@pytest.fixture(scope="module")
+def sample_data(scraper):
+    """Load sample Psalms 83 data once; tests must not modify it."""
+    return scraper.load_sample_data()
 
 
 class TestPsalms83Scraper:
     """Tests for the Psalms83Scraper class."""
     
-    @pytest.fixture
-    def scraper(self):
-        """Create a scraper instance for testing."""
-        return Psalms83Scraper(data_dir="data")
-    
-    @pytest.fixture
-    def sample_data(self, scraper):
-        """Load sample Psalms 83 data."""
-        return scraper.load_sample_data()
-    
     def test_scraper_initialization(self, scraper):
         """Test that the scraper initializes correctly."""
         assert scraper is not None
@@ -41,6 +53,16 @@ class TestPsalms83Scraper:
         assert sample_data is not None
         assert isinstance(sample_data, dict)
     
+    def test_sample_data_read_once(self):
+        """Test that repeated loads reuse the file bytes but return independent copies."""
+        first = Psalms83Scraper(data_dir="data").load_sample_data()
+        
+        with patch('builtins.open', wraps=open) as opened:
+            second = Psalms83Scraper(data_dir="data").load_sample_data()
+        
+        opened.assert_not_called()
+        assert second == first and second is not first
+    
     def test_sample_data_structure(self, sample_data):
         """Test that sample data has the expected structure."""
         required_fields = ['book', 'chapter', 'verses', 'study_notes', 'footnotes']
@@ -156,16 +178,6 @@ class TestPsalms83Scraper:
 class TestPsalms83Formatting:
     """Tests for Psalms 83 formatting functions."""
     
-    @pytest.fixture
-    def scraper(self):
-        """Create a scraper instance for testing."""
-        return Psalms83Scraper(data_dir="data")
-    
-    @pytest.fixture
-    def sample_data(self, scraper):
-        """Load sample Psalms 83 data."""
-        return scraper.load_sample_data()
-    
     def test_format_for_print(self, scraper, sample_data):
         """Test print formatting."""
         output = scraper.format_for_print(sample_data)
@@ -195,19 +207,49 @@ class TestPsalms83Formatting:
         """Test that HTML output contains all verses."""
         output = scraper.format_for_html(sample_data)
         
-        for i in range(1, 19):  # Verses 1-18
-            # Check that verse number appears in output
-            assert f'>{i}</span>' in output or str(i) in output
+        # Every verse number (1-18) appears in its own span
+        numbers = {int(n) for n in VERSE_NUM_SPAN_RE.findall(output)}
+        assert set(range(1, 19)) <= numbers
+    
+    def test_format_to_file(self, scraper, sample_data, tmp_path):
+        """Test that the streaming formatters write the same output to a file."""
+        print_file = tmp_path / 'psalm83.txt'
+        html_file = tmp_path / 'psalm83.html'
+        
+        with open(print_file, 'w', encoding='utf-8') as fp:
+            scraper.format_for_print_to(sample_data, fp)
+        with open(html_file, 'w', encoding='utf-8') as fp:
+            scraper.format_for_html_to(sample_data, fp)
+        
+        assert print_file.read_text(encoding='utf-8') == scraper.format_for_print(sample_data)
+        assert html_file.read_text(encoding='utf-8') == scraper.format_for_html(sample_data)
+    
+    def test_format_with_out_stream(self, scraper, sample_data):
+        """Test that passing out= writes to the stream and returns None."""
+        out = io.StringIO()
+        
+        assert scraper.format_for_html(sample_data, out=out) is None
+        assert out.getvalue() == scraper.format_for_html(sample_data)
+    
+    def test_html_escapes_content(self, scraper):
+        """Test that text content is HTML-escaped."""
+        data = {
+            'chapter': 83,
+            'superscription': 'A <b>song</b>',
+            'verses': [{'number': 1, 'text': 'x < y & z'}],
+            'study_notes': [{'reference': '83:1', 'content': '<script>alert(1)</script>'}]
+        }
+        
+        output = scraper.format_for_html(data)
+        
+        assert 'A &lt;b&gt;song&lt;/b&gt;' in output
+        assert '<span class="verse-num">1</span> x &lt; y &amp; z' in output
+        assert '<script>' not in output
 
 
 class TestPsalms83HTMLParsing:
     """Tests for HTML parsing functionality."""
     
-    @pytest.fixture
-    def scraper(self):
-        """Create a scraper instance for testing."""
-        return Psalms83Scraper(data_dir="data")
-    
     def test_parse_empty_html(self, scraper):
         """Test parsing empty HTML."""
         result = scraper.parse_html_content("")
@@ -234,21 +276,216 @@ class TestPsalms83HTMLParsing:
         
         assert result is not None
         assert len(result['verses']) >= 0  # May or may not parse depending on exact selectors
+    
+    def test_default_parser_is_bs4(self, scraper):
+        """Test that the optional selectolax backend is opt-in."""
+        assert scraper.parser == 'bs4'
+    
+    def test_backends_match_on_psalms_83(self, samples_dir):
+        """Test that both backends extract identical data from the Psalms 83 page."""
+        pytest.importorskip('selectolax')
+        html = (samples_dir / 'psalms_83_live.html').read_text(encoding='utf-8')
+        
+        expected = Psalms83Scraper(data_dir="data", parser='bs4').parse_html_content(html)
+        result = Psalms83Scraper(data_dir="data", parser='selectolax').parse_html_content(html)
+        fast = Psalms83Scraper(data_dir="data", parser='bs4').parse_html_content_fast(html)
+        
+        for data in (expected, result, fast):
+            data['metadata'].pop('scraped_at')
+        assert result == expected
+        assert fast == expected
+        assert expected['superscription'] and expected['cross_references']
+    
+    def test_streaming_cross_references_match_bs4(self, samples_dir):
+        """Test that the iterparse path yields the same cross-references."""
+        pytest.importorskip('lxml')
+        html = (samples_dir / 'psalms_83_live.html').read_text(encoding='utf-8')
+        scraper = Psalms83Scraper(data_dir="data", parser='bs4')
+        
+        expected = scraper.parse_html_content(html)['cross_references']
+        streamed = scraper.iter_cross_references_streaming(html.encode('utf-8'))
+        
+        assert list(streamed) == expected
+    
+    def test_parse_avoids_css_selectors(self, samples_dir):
+        """Test that the bs4 path uses find()/find_all() rather than soupsieve."""
+        html = (samples_dir / 'psalms_83_live.html').read_text(encoding='utf-8')
+        scraper = Psalms83Scraper(data_dir="data", parser='bs4')
+        
+        with patch.object(Tag, 'select', side_effect=AssertionError('select() used')), \
+                patch.object(Tag, 'select_one', side_effect=AssertionError('select_one() used')):
+            result = scraper.parse_html_content(html)
+        
+        assert result['superscription']
+    
+    def test_bs4_path_uses_lxml(self):
+        """Test that BeautifulSoup is always built with the C-based lxml parser."""
+        pytest.importorskip('lxml')
+        scraper = Psalms83Scraper(data_dir="data", parser='bs4')
+        html = '<p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>'
+        
+        with patch('src.scrapers.psalms_scraper.BeautifulSoup', wraps=BeautifulSoup) as soup_cls:
+            result = scraper.parse_html_content(html)
+        
+        assert soup_cls.called
+        assert {call.args[1] for call in soup_cls.call_args_list} == {'lxml'}
+        assert result['verses'][0]['number'] == 1
+    
+    def test_bs4_path_parses_only_content(self):
+        """Test that pages with classed content are parsed once through the strainer."""
+        scraper = Psalms83Scraper(data_dir="data", parser='bs4')
+        html = (
+            '<html><head><script>var x = 1;</script></head><body><nav><a href="/">Home</a></nav>'
+            '<p class="superscription">A song.</p>'
+            '<p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>'
+            '</body></html>'
+        )
+        
+        with patch('src.scrapers.psalms_scraper.BeautifulSoup', wraps=BeautifulSoup) as soup_cls:
+            result = scraper.parse_html_content(html)
+        
+        soup_cls.assert_called_once()
+        assert soup_cls.call_args.kwargs['parse_only'] is CONTENT_STRAINER
+        assert result['superscription'] == 'A song.'
+        assert len(result['verses']) == 1
+    
+    def test_bs4_path_parses_unclassed_content_once_in_full(self):
+        """Test that pages with div#tt4 skip the strainer instead of parsing twice."""
+        scraper = Psalms83Scraper(data_dir="data", parser='bs4')
+        html = (
+            '<div id="tt4"><p class="themeScrp">A song.</p></div>'
+            '<p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>'
+        )
+        
+        with patch('src.scrapers.psalms_scraper.BeautifulSoup', wraps=BeautifulSoup) as soup_cls:
+            result = scraper.parse_html_content(html)
+        
+        soup_cls.assert_called_once()
+        assert soup_cls.call_args.kwargs['parse_only'] is None
+        assert result['superscription'] == 'A song.'
+    
+    def test_bs4_path_parses_once_without_superscription(self):
+        """Test that pages lacking a superscription are not re-parsed in full."""
+        scraper = Psalms83Scraper(data_dir="data", parser='bs4')
+        html = '<p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>'
+        
+        with patch('src.scrapers.psalms_scraper.BeautifulSoup', wraps=BeautifulSoup) as soup_cls:
+            result = scraper.parse_html_content(html)
+        
+        soup_cls.assert_called_once()
+        assert result['superscription'] is None
+    
+    def test_backends_agree_on_mixed_superscription(self):
+        """Test that div#tt4 wins over its p.themeScrp on both backends."""
+        pytest.importorskip('selectolax')
+        html = (
+            '<div id="tt4">Intro<p class="themeScrp">A song</p>tail</div>'
+            '<p data-pid="2">Not a verse.</p>'
+            '<p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>'
+        )
+        
+        results = [Psalms83Scraper(data_dir="data", parser=parser).parse_html_content(html)
+                   for parser in ('bs4', 'selectolax')]
+        
+        assert [r['superscription'] for r in results] == ['IntroA songtail'] * 2
+        assert results[0]['verses'] == results[1]['verses']
+        assert len(results[0]['verses']) == 1
+    
+    def test_strain_html_can_be_disabled(self):
+        """Test that strain_html=False parses the whole page."""
+        scraper = Psalms83Scraper(data_dir="data", parser='bs4')
+        html = '<p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>'
+        
+        with patch.dict(psalms_scraper.SCRAPING_CONFIG, {'strain_html': False}), \
+                patch.object(psalms_scraper, 'BeautifulSoup', wraps=BeautifulSoup) as soup_cls:
+            result = scraper.parse_html_content(html)
+        
+        assert soup_cls.call_args.kwargs['parse_only'] is None
+        assert result['verses'][0]['number'] == 1
+    
+    def test_parse_body_fragment(self, scraper):
+        """Test that document.body.innerHTML fragments parse like full documents."""
+        body = (
+            '<div id="tt4"><p class="themeScrp">A song.</p></div>'
+            '<p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>'
+        )
+        
+        fragment = scraper.parse_html_content(body)
+        document = scraper.parse_html_content(f'<html><body>{body}</body></html>')
+        
+        assert fragment['superscription'] == document['superscription'] == 'A song.'
+        assert fragment['verses'] == document['verses']
+    
+    def test_parse_verse_numbers(self, scraper):
+        """Test verse numbers given as bare digits or mixed with other text."""
+        html = '''
+        <p class="sb"><span class="verseNum">12</span> Bare number.</p>
+        <p class="sb"><span class="verseNum">v. 13</span> Mixed number.</p>
+        <p class="sb"><span class="verseNum">14 a</span> Number with suffix.</p>
+        '''
+        
+        result = scraper.parse_html_content(html)
+        
+        assert [v['number'] for v in result['verses']] == [12, 13, 14]
+        assert result['verses'][0]['text'] == 'Bare number.'
+    
+    def test_parse_superscription_without_class(self, scraper):
+        """Test that unclassed superscriptions survive the content strainer."""
+        html = '''
+        <html>
+            <body>
+                <div id="tt4">A melody of Asaph.</div>
+                <p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>
+            </body>
+        </html>
+        '''
+        
+        result = scraper.parse_html_content(html)
+        
+        assert result['superscription'] == 'A melody of Asaph.'
+        assert result['cross_references'] == []
+    
+    @pytest.mark.parametrize('parser', ['bs4', 'selectolax'])
+    def test_verse_priority_survives_fallback_page(self, parser):
+        """Test that p.sb still wins after a page only matched by a fallback lookup."""
+        if parser == 'selectolax':
+            pytest.importorskip('selectolax')
+        fallback_page = '<p data-pid="1"><span class="verseNum">1</span> First verse.</p>'
+        psalm_page = '''
+        <p class="sb"><span class="verseNum">1</span> O God, do not keep silent.</p>
+        <p data-pid="9">Not a verse.</p>
+        <p class="sb"><span class="verseNum">2</span> For look! your enemies are in an uproar.</p>
+        '''
+        scraper = Psalms83Scraper(data_dir="data", parser=parser)
+        
+        assert scraper.parse_html_content(fallback_page)['verses'][0]['text'] == 'First verse.'
+        verses = scraper.parse_html_content(psalm_page)['verses']
+        
+        assert [v['number'] for v in verses] == [1, 2]
+        assert all('Not a verse' not in v['text'] for v in verses)
+    
+    @pytest.mark.parametrize('parser', ['bs4', 'selectolax'])
+    def test_superscription_priority_survives_fallback_page(self, parser):
+        """Test that div#tt4 still wins over a bare sup after a fallback page."""
+        if parser == 'selectolax':
+            pytest.importorskip('selectolax')
+        fallback_page = '''
+        <sup>A song.</sup>
+        <p class="sb"><span class="verseNum">1</span> First verse.</p>
+        '''
+        psalm_page = '''
+        <p class="sb"><span class="verseNum">1</span> O God, do not keep<sup>x</sup> silent.</p>
+        <div id="tt4"><p class="themeScrp">A melody of Asaph.</p></div>
+        '''
+        scraper = Psalms83Scraper(data_dir="data", parser=parser)
+        
+        assert scraper.parse_html_content(fallback_page)['superscription'] == 'A song.'
+        assert scraper.parse_html_content(psalm_page)['superscription'] == 'A melody of Asaph.'
 
 
 class TestPsalms83DataStorage:
     """Tests for data storage functionality."""
     
-    @pytest.fixture
-    def scraper(self):
-        """Create a scraper instance with temp directory."""
-        return Psalms83Scraper(data_dir="data")
-    
-    @pytest.fixture
-    def sample_data(self, scraper):
-        """Load sample Psalms 83 data."""
-        return scraper.load_sample_data()
-    
     def test_save_chapter_data(self, scraper, sample_data, tmp_path):
         """Test saving chapter data to file."""
         # Use a temp scraper for this test
@@ -265,39 +502,79 @@ class TestPsalms83DataStorage:
         assert saved_data['book'] == 'Psalms'
         assert saved_data['chapter'] == 83
         assert len(saved_data['verses']) == 18
+    
+    def test_save_after_data_dir_removed(self, sample_data, tmp_path):
+        """Test that a new scraper recreates directories removed since the last one."""
+        Psalms83Scraper(data_dir=str(tmp_path))
+        shutil.rmtree(tmp_path / "processed")
+        
+        filepath = Psalms83Scraper(data_dir=str(tmp_path)).save_chapter_data(sample_data, "psalms_83.json")
+        
+        assert os.path.exists(filepath)
+    
+    def test_default_filenames_are_unique(self, sample_data, tmp_path):
+        """Test that back-to-back saves never overwrite each other."""
+        temp_scraper = Psalms83Scraper(data_dir=str(tmp_path))
+        
+        paths = {temp_scraper.save_chapter_data(sample_data) for _ in range(3)}
+        
+        assert len(paths) == 3
+        assert all(os.path.exists(path) for path in paths)
 
 
 class TestPsalms83Workflow:
     """Tests for the complete scraping workflow."""
     
-    @pytest.fixture
-    def scraper(self):
-        """Create a scraper instance for testing."""
-        return Psalms83Scraper(data_dir="data")
-    
     def test_workflow_has_all_steps(self, scraper):
         """Test that workflow includes all necessary steps."""
         workflow = scraper.get_scraping_workflow()
         steps = workflow['steps']
         
-        # Check for key steps
+        # Page actions are batched into a single MCP call
+        batch = steps[0]
+        assert batch['tool'] == 'playwright-browser_batch_execute'
+        batch_actions = [s['action'] for s in batch['params']['steps']]
+        
+        assert 'Navigate to Psalms 83' in batch_actions
+        assert 'Wait for content to load' in batch_actions
+        assert 'Take screenshot' in batch_actions
+        assert 'Extract HTML' in batch_actions
+        assert batch['params']['globalExpectation']['includeSnapshot'] is False
+        
         step_actions = [s['action'] for s in steps]
+        assert 'Get page snapshot' not in step_actions
+    
+    def test_workflow_snapshot_on_request(self, scraper):
+        """Test that a snapshot step is only added when requested."""
+        steps = scraper.get_scraping_workflow(include_snapshot=True)['steps']
+        
+        assert steps[1]['action'] == 'Get page snapshot'
+        assert [s['step'] for s in steps] == list(range(1, len(steps) + 1))
+        assert len(scraper.get_scraping_workflow()['steps']) == len(steps) - 1
+    
+    def test_workflow_copies_are_independent(self, scraper):
+        """Test that modifying a returned workflow does not affect later calls."""
+        workflow = scraper.get_scraping_workflow()
+        workflow['steps'][0]['params']['steps'].clear()
+        workflow['steps'].pop()
+        
+        fresh = scraper.get_scraping_workflow()
         
-        assert 'Navigate to Psalms 83' in step_actions
-        assert 'Wait for content to load' in step_actions
-        assert 'Take screenshot' in step_actions
-        assert 'Get page snapshot' in step_actions
+        assert len(fresh['steps']) == 3
+        assert len(fresh['steps'][0]['params']['steps']) == 4
     
     def test_workflow_screenshot_is_jpeg(self, scraper):
         """Test that workflow specifies JPEG format for screenshots."""
         workflow = scraper.get_scraping_workflow()
+        batch_steps = workflow['steps'][0]['params']['steps']
         
-        for step in workflow['steps']:
-            if step['action'] == 'Take screenshot':
-                params = step.get('params', {})
-                assert params.get('type') == 'jpeg', "Screenshot should be JPEG format"
-                assert 'jpeg' in params.get('filename', '').lower(), \
-                    "Screenshot filename should have .jpeg extension"
+        screenshots = [s for s in batch_steps if s['action'] == 'Take screenshot']
+        assert screenshots
+        for step in screenshots:
+            params = step.get('params', {})
+            assert params.get('type') == 'jpeg', "Screenshot should be JPEG format"
+            assert 'jpeg' in params.get('filename', '').lower(), \
+                "Screenshot filename should have .jpeg extension"
 
 
 def test_psalms_scraper_import():
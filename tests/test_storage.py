@@ -0,0 +1,142 @@
+"""
+Tests for the data storage utilities.
+"""
+
+import csv
+import json
+import os
+
+import pytest
+
+from src.utils.storage import DataStorage, read_json, write_bytes_if_changed
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create a storage instance rooted in a temporary directory."""
+    return DataStorage(base_dir=str(tmp_path))
+
+
+class TestDataStorage:
+    """Tests for DataStorage JSON helpers."""
+
+    def test_save_and_load_json(self, storage):
+        """Test that raw and processed JSON round-trip."""
+        data = {'book': 'Psalms', 'chapter': 83, 'superscription': 'A melody of Aʹsaph.'}
+
+        for processed in (False, True):
+            storage.save_json(data, 'psalms_83.json', processed=processed)
+            assert storage.load_json('psalms_83.json', processed=processed) == data
+
+    def test_directories_recreated_after_removal(self, tmp_path, monkeypatch):
+        """Test that relative base dirs are created afresh after a chdir."""
+        for name in ('first', 'second'):
+            workdir = tmp_path / name
+            workdir.mkdir()
+            monkeypatch.chdir(workdir)
+
+            DataStorage(base_dir='data').save_json({'chapter': 1}, 'chapter.json')
+
+            assert (workdir / 'data' / 'raw' / 'chapter.json').exists()
+
+    def test_raw_json_is_compact(self, storage):
+        """Test that raw JSON is compact and processed JSON is indented."""
+        raw = storage.save_json({'chapter': 83}, 'compact.json')
+        processed = storage.save_json({'chapter': 83}, 'indented.json', processed=True)
+
+        with open(raw, encoding='utf-8') as f:
+            assert f.read() == '{"chapter":83}'
+        with open(processed, encoding='utf-8') as f:
+            assert '\n  "chapter": 83' in f.read()
+
+    def test_save_jsonl(self, storage):
+        """Test that records are written one JSON object per line."""
+        records = ({'chapter': n, 'verses': []} for n in (1, 2, 3))
+
+        filepath = storage.save_jsonl(records, 'psalms.jsonl')
+
+        with open(filepath, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line)['chapter'] for line in lines] == [1, 2, 3]
+
+    def test_save_verses_csv(self, storage):
+        """Test that verses are written with a header row in first-verse key order."""
+        verses = [
+            {'number': 1, 'text': 'O God, do not keep silent;'},
+            {'number': 2, 'text': 'For look! your enemies are in an uproar;'},
+            {'number': 3},
+        ]
+
+        filepath = storage.save_verses_csv(verses, 'psalms_83.csv')
+
+        with open(filepath, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ['number', 'text'],
+            ['1', 'O God, do not keep silent;'],
+            ['2', 'For look! your enemies are in an uproar;'],
+            ['3', ''],
+        ]
+
+    def test_book_saved_as_json_by_default(self, storage):
+        """Test that books stay a single JSON document however long they are."""
+        book_data = {'book': 'Psalms', 'chapters': [{'chapter': n, 'verses': []} for n in range(1, 151)]}
+
+        filepath = storage.save_book_data('Psalms', book_data)
+
+        assert filepath.endswith('.json')
+        assert read_json(filepath) == book_data
+
+    def test_book_saved_as_jsonl_on_request(self, storage):
+        """Test that books are written and read back a chapter per line when asked."""
+        chapters = [{'chapter': n, 'verses': []} for n in range(1, 4)]
+        book_data = {'testament': 'hebrew', 'chapters': chapters}
+
+        filepath = storage.save_book_data('Psalms', book_data, jsonl=True)
+
+        assert filepath.endswith('.jsonl')
+        header, *rest = storage.iter_book_jsonl(os.path.basename(filepath))
+        assert header == {'book': 'Psalms', 'testament': 'hebrew'}
+        assert rest == chapters
+        assert os.path.basename(filepath) in storage.get_all_saved_books()
+
+
+def test_read_json_returns_independent_copies(tmp_path):
+    """Test that cached reads hand out fresh objects and see rewrites."""
+    filepath = tmp_path / 'chapter.json'
+    filepath.write_text('{"verses": [1, 2]}', encoding='utf-8')
+
+    first = read_json(str(filepath))
+    first['verses'].append(3)
+    assert read_json(str(filepath)) == {'verses': [1, 2]}
+
+    filepath.write_text('{"verses": [1, 2, 3, 4]}', encoding='utf-8')
+    assert read_json(str(filepath)) == {'verses': [1, 2, 3, 4]}
+
+
+def test_write_bytes_if_changed(tmp_path):
+    """Test that identical bytes are not rewritten but changes and deletions are."""
+    filepath = str(tmp_path / 'page.png')
+    digests = {}
+
+    assert write_bytes_if_changed(filepath, b'png-1', digests)
+    assert not write_bytes_if_changed(filepath, b'png-1', digests)
+    assert write_bytes_if_changed(filepath, b'png-2', digests)
+
+    os.remove(filepath)
+    assert write_bytes_if_changed(filepath, b'png-2', digests)
+    with open(filepath, 'rb') as f:
+        assert f.read() == b'png-2'
+
+
+def test_writers_invalidate_cached_reads(tmp_path):
+    """Test that same-size rewrites within one timestamp tick are not read stale."""
+    filepath = str(tmp_path / 'chapter.json')
+    write_bytes_if_changed(filepath, b'{"chapter": 1}', {})
+    assert read_json(filepath) == {'chapter': 1}
+    stat = os.stat(filepath)
+
+    write_bytes_if_changed(filepath, b'{"chapter": 2}', {})
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert read_json(filepath) == {'chapter': 2}
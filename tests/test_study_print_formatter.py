@@ -7,14 +7,71 @@ print-ready HTML output from Bible study data.
 
 import pytest
 import json
+import mmap
 import os
+import re
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+from lxml import html as lxml_html
 from src.formatters.study_print_formatter import StudyBiblePrintFormatter
 
+# Markup every rendered chapter page must contain
+REQUIRED_HTML = (
+    '<!DOCTYPE html>',
+    '<html lang="en">',
+    '<head>',
+    '<meta charset="UTF-8">',
+    '<title>',
+    '<style>',
+    '<body>',
+    '<header class="page-header">',
+    '<div class="content-grid">',
+    '<div class="verses-column">',
+    '<div class="study-column">',
+    '<footer class="page-footer">',
+    '</body>',
+    '</html>',
+)
+# All of REQUIRED_HTML as one alternation, so a single scan finds them
+REQUIRED_HTML_RE = re.compile('|'.join(map(re.escape, REQUIRED_HTML)))
+
+
+@pytest.fixture
+def stub_pdf_renderer(monkeypatch):
+    """
+    Replace WeasyPrint with a stub that writes a tiny PDF header.
+    
+    For tests of generate_pdf's path handling that do not need a real render.
+    """
+    def write_pdf(target, **kwargs):
+        Path(target).write_bytes(b'%PDF-stub')
+    
+    monkeypatch.setitem(
+        sys.modules, 'weasyprint',
+        SimpleNamespace(HTML=lambda string: SimpleNamespace(write_pdf=write_pdf))
+    )
+
 
 class TestStudyBiblePrintFormatter:
     """Tests for StudyBiblePrintFormatter class."""
     
+    # Shared inputs; the formatter never modifies its data, so tests use them as-is
+    MINIMAL = {'book': 'Test', 'chapter': 1, 'verses': []}
+    ONE_VERSE = {'book': 'Test', 'chapter': 1, 'verses': [{'number': 1, 'text': 'Test verse'}]}
+    TEST_VERSES = [
+        {'number': 1, 'text': 'Test verse 1'},
+        {'number': 2, 'text': 'Test verse 2'}
+    ]
+    GENESIS = {
+        'book': 'Genesis',
+        'chapter': 1,
+        'verses': [
+            {'number': 1, 'text': 'In the beginning God created the heavens and the earth.'},
+            {'number': 2, 'text': 'Now the earth was formless and desolate.'}
+        ]
+    }
+    
     def test_formatter_instantiation(self):
         """Test that formatter can be instantiated without errors."""
         formatter = StudyBiblePrintFormatter()
@@ -31,11 +88,7 @@ class TestStudyBiblePrintFormatter:
     def test_generate_html_minimal_data(self):
         """Test HTML generation with minimal data."""
         formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Test',
-            'chapter': 1,
-            'verses': []
-        }
+        data = self.MINIMAL
         html = formatter.generate_html(data)
         
         assert isinstance(html, str)
@@ -44,58 +97,26 @@ class TestStudyBiblePrintFormatter:
         assert 'Test 1' in html
         assert 'DOCTYPE' in html
     
-    def test_generate_html_missing_book(self):
-        """Test that ValueError is raised when book is missing."""
-        formatter = StudyBiblePrintFormatter()
-        data = {
-            'chapter': 1,
-            'verses': []
-        }
-        
-        with pytest.raises(ValueError, match="book"):
-            formatter.generate_html(data)
-    
-    def test_generate_html_missing_chapter(self):
-        """Test that ValueError is raised when chapter is missing."""
-        formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Test',
-            'verses': []
-        }
-        
-        with pytest.raises(ValueError, match="chapter"):
-            formatter.generate_html(data)
-    
-    def test_generate_html_invalid_verses(self):
-        """Test that ValueError is raised when verses is not a list."""
-        formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Test',
-            'chapter': 1,
-            'verses': 'not a list'
-        }
-        
-        with pytest.raises(ValueError, match="verses"):
-            formatter.generate_html(data)
+    @pytest.mark.parametrize('data, match', [
+        pytest.param({'chapter': 1, 'verses': []}, "book", id='missing-book'),
+        pytest.param({'book': 'Test', 'verses': []}, "chapter", id='missing-chapter'),
+        pytest.param({'book': 'Test', 'chapter': 1, 'verses': 'not a list'}, "verses", id='verses-not-list'),
+    ])
+    def test_generate_html_rejects_bad_input(self, shared_formatter, data, match):
+        """Test that ValueError names the missing or invalid field."""
+        with pytest.raises(ValueError, match=match):
+            shared_formatter.generate_html(data)
     
     def test_generate_html_with_verses(self):
         """Test HTML generation with verse data."""
         formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Genesis',
-            'chapter': 1,
-            'verses': [
-                {'number': 1, 'text': 'In the beginning God created the heavens and the earth.'},
-                {'number': 2, 'text': 'Now the earth was formless and desolate.'}
-            ]
-        }
-        html = formatter.generate_html(data)
+        tree = lxml_html.fromstring(formatter.generate_html(self.GENESIS))
         
-        assert 'Genesis 1' in html
-        assert 'class="verse"' in html
-        assert 'class="verse-num"' in html
-        assert 'In the beginning' in html
-        assert 'formless and desolate' in html
+        assert tree.findtext('.//title').startswith('Genesis 1')
+        verses = tree.xpath('//p[@class="verse"]')
+        assert [verse.findtext('span[@class="verse-num"]') for verse in verses] == ['1', '2']
+        assert 'In the beginning' in verses[0].text_content()
+        assert 'formless and desolate' in verses[1].text_content()
     
     def test_generate_html_with_superscription(self):
         """Test HTML generation with superscription."""
@@ -122,11 +143,7 @@ class TestStudyBiblePrintFormatter:
     def test_format_verses_with_data(self):
         """Test verse formatting with actual verse data."""
         formatter = StudyBiblePrintFormatter()
-        verses = [
-            {'number': 1, 'text': 'Test verse 1'},
-            {'number': 2, 'text': 'Test verse 2'}
-        ]
-        html = formatter._format_verses(verses, '')
+        html = formatter._format_verses(self.TEST_VERSES, '')
         
         assert 'class="verse"' in html
         assert 'class="verse-num"' in html
@@ -149,14 +166,7 @@ class TestStudyBiblePrintFormatter:
     def test_format_study_panel_empty(self):
         """Test study panel formatting with no study materials."""
         formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Test',
-            'chapter': 1,
-            'verses': [],
-            'study_notes': [],
-            'footnotes': [],
-            'cross_references': []
-        }
+        data = {**self.MINIMAL, 'study_notes': [], 'footnotes': [], 'cross_references': []}
         html = formatter._format_study_panel(data)
         
         assert isinstance(html, str)
@@ -185,10 +195,9 @@ class TestStudyBiblePrintFormatter:
         assert 'Test study note' in html
     
     @pytest.mark.unit
-    def test_psalms_83_sample_data(self, psalms_83_sample):
+    def test_psalms_83_sample_data(self, psalms_83_html):
         """Test HTML generation with Psalms 83 sample data."""
-        formatter = StudyBiblePrintFormatter()
-        html = formatter.generate_html(psalms_83_sample)
+        html = psalms_83_html
         
         # Validate structure
         assert '<html' in html
@@ -206,61 +215,36 @@ class TestStudyBiblePrintFormatter:
         assert 'class="study-column"' in html
         
         # Check that we have all 18 verses
-        verse_count = html.count('class="verse"')
+        verse_count = len(lxml_html.fromstring(html).xpath('//p[@class="verse"]'))
         assert verse_count == 18, f"Expected 18 verses, found {verse_count}"
     
     @pytest.mark.unit
     def test_html_structure_validity(self):
         """Test that generated HTML has proper structure."""
         formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Test',
-            'chapter': 1,
-            'verses': [{'number': 1, 'text': 'Test'}]
-        }
-        html = formatter.generate_html(data)
+        html = formatter.generate_html(self.ONE_VERSE)
         
         # Check essential HTML elements
-        assert '<!DOCTYPE html>' in html
-        assert '<html lang="en">' in html
-        assert '<head>' in html
-        assert '<meta charset="UTF-8">' in html
-        assert '<title>' in html
-        assert '<style>' in html
-        assert '<body>' in html
-        assert '<header class="page-header">' in html
-        assert '<div class="content-grid">' in html
-        assert '<div class="verses-column">' in html
-        assert '<div class="study-column">' in html
-        assert '<footer class="page-footer">' in html
-        assert '</body>' in html
-        assert '</html>' in html
+        found = set(REQUIRED_HTML_RE.findall(html))
+        missing = [element for element in REQUIRED_HTML if element not in found]
+        assert missing == [], f"Missing HTML elements: {missing}"
 
     @pytest.mark.unit
+    @pytest.mark.slow
     def test_generate_pdf_minimal_data(self, tmp_path):
         """Test PDF generation with minimal data."""
         formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Test',
-            'chapter': 1,
-            'verses': [{'number': 1, 'text': 'Test verse'}]
-        }
-        
         output_path = tmp_path / "test.pdf"
-        formatter.generate_pdf(data, str(output_path))
+        formatter.generate_pdf(self.ONE_VERSE, str(output_path))
         
         assert output_path.exists()
         assert output_path.stat().st_size > 0
     
     @pytest.mark.unit
-    def test_generate_pdf_creates_directories(self, tmp_path):
+    def test_generate_pdf_creates_directories(self, tmp_path, stub_pdf_renderer):
         """Test that generate_pdf creates parent directories."""
         formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Test',
-            'chapter': 1,
-            'verses': []
-        }
+        data = self.MINIMAL
         
         # Use nested path that doesn't exist
         output_path = tmp_path / "subdir" / "another" / "test.pdf"
@@ -273,39 +257,33 @@ class TestStudyBiblePrintFormatter:
     def test_generate_pdf_empty_path_raises_error(self):
         """Test that empty output path raises ValueError."""
         formatter = StudyBiblePrintFormatter()
-        data = {
-            'book': 'Test',
-            'chapter': 1,
-            'verses': []
-        }
+        data = self.MINIMAL
         
         with pytest.raises(ValueError, match="output_path"):
             formatter.generate_pdf(data, "")
     
     @pytest.mark.unit
-    def test_generate_pdf_file_size(self, tmp_path, psalms_83_sample):
-        """Test that generated PDF is within size limits."""
-        formatter = StudyBiblePrintFormatter()
-        output_path = tmp_path / "psalms_83.pdf"
-        
-        formatter.generate_pdf(psalms_83_sample, str(output_path))
-        
-        file_size = output_path.stat().st_size
+    @pytest.mark.slow
+    def test_generate_pdf_file_size(self, psalms_83_pdf):
+        """Test that the Psalms 83 PDF is a valid PDF within size limits."""
+        with open(psalms_83_pdf, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pdf:
+            file_size = len(pdf)
+            assert pdf[:5] == b'%PDF-', "File is not a valid PDF"
         # Should be less than 500KB (target from plan)
         assert file_size < 500_000, f"PDF size {file_size} exceeds 500KB limit"
         # Should be at least 1KB (reasonable minimum)
         assert file_size > 1000, f"PDF size {file_size} seems too small"
+
+
+def test_package_exports_formatter_lazily():
+    """Test that the formatters package loads its formatter only on first access."""
+    import subprocess
     
-    @pytest.mark.unit
-    def test_generate_pdf_with_psalms_83(self, tmp_path, psalms_83_sample):
-        """Test PDF generation with complete Psalms 83 data."""
-        formatter = StudyBiblePrintFormatter()
-        output_path = tmp_path / "psalms_83_test.pdf"
-        
-        formatter.generate_pdf(psalms_83_sample, str(output_path))
-        
-        assert output_path.exists()
-        # Verify it's a PDF by checking magic bytes
-        with open(output_path, 'rb') as f:
-            header = f.read(5)
-            assert header == b'%PDF-', "File is not a valid PDF"
+    code = (
+        "import sys, src.formatters as f; "
+        "assert 'src.formatters.study_print_formatter' not in sys.modules; "
+        "from src.formatters import StudyBiblePrintFormatter; "
+        "assert StudyBiblePrintFormatter is f.study_print_formatter.StudyBiblePrintFormatter"
+    )
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
@@ -0,0 +1,250 @@
+"""
+Tests for the chapter data validators.
+"""
+
+import pytest
+
+from src.utils import validators
+from src.utils.validators import (
+    _SCHEMAS,
+    _expected_verse_numbers,
+    _get_validator,
+    ChapterColumns,
+    Verse,
+    is_valid_chapter_data,
+    is_valid_chapter_shape,
+    validate_chapter_columns,
+    validate_chapter_completeness,
+    validate_cross_reference,
+    validate_footnote,
+    validate_psalms_83_specific,
+    validate_study_note,
+    validate_verse_structure,
+)
+
+
+def _chapter(verse_count=3):
+    """Build a small, valid chapter dictionary."""
+    return {
+        'book': 'Psalms',
+        'chapter': 83,
+        'verses': [{'number': n, 'text': f'Verse {n}.'} for n in range(1, verse_count + 1)],
+        'study_notes': [{'id': 'sn1', 'reference': '83:1', 'content': 'A note.'}],
+        'footnotes': [{'id': 'fn1', 'content': 'Or "Selah."'}],
+        'cross_references': [{'id': 'x1', 'verses': ['Ps 28:1']}],
+    }
+
+
+class TestItemValidators:
+    """Tests for the per-item structure validators."""
+
+    @pytest.mark.parametrize('verse, expected', [
+        ({'number': 1, 'text': 'O God, do not keep silent;'}, True),
+        ({'number': 1, 'text': 'Text', 'footnotes': [], 'cross_references': []}, True),
+        ({'number': '1', 'text': 'Text'}, False),
+        ({'number': 1, 'text': '   '}, False),
+        ({'number': 1, 'text': 'Text', 'footnotes': 'fn1'}, False),
+        ({'text': 'Text'}, False),
+    ])
+    def test_validate_verse_structure(self, verse, expected):
+        """Test required fields, field types and blank text."""
+        assert validate_verse_structure(verse) is expected
+
+    @pytest.mark.parametrize('backend', ['python', 'fastjsonschema'])
+    @pytest.mark.parametrize('number, expected', [(1, True), (1.0, False), (True, False), ('1', False)])
+    def test_verse_number_types_agree_across_backends(self, backend, number, expected, monkeypatch):
+        """Test that the compiled schema and the Python checks accept the same numbers."""
+        if backend == 'fastjsonschema':
+            pytest.importorskip('fastjsonschema')
+        else:
+            monkeypatch.setattr(validators, 'fastjsonschema', None)
+        _get_validator.cache_clear()
+        try:
+            assert validate_verse_structure({'number': number, 'text': 'Text'}) is expected
+        finally:
+            _get_validator.cache_clear()
+
+    def test_verse_revalidated_after_mutation(self):
+        """Test that a verse dict is checked afresh on every call, not by identity."""
+        verse = {'number': 1, 'text': 'O God, do not keep silent;'}
+        assert validate_verse_structure(verse)
+
+        verse['text'] = ''
+
+        assert not validate_verse_structure(verse)
+
+    def test_verse_record(self):
+        """Test that Verse records round-trip and validate without dict checks."""
+        verse = {'number': 1, 'text': 'O God, do not keep silent;', 'footnotes': [], 'cross_references': []}
+
+        record = Verse.from_dict(verse)
+
+        assert record.to_dict() == verse
+        assert validate_verse_structure(record)
+        assert not validate_verse_structure(Verse(2, ' '))
+        with pytest.raises(TypeError):
+            Verse('1', 'Text')
+        with pytest.raises(TypeError):
+            Verse(True, 'Text')
+        with pytest.raises(TypeError):
+            Verse.from_dict({'number': 1, 'text': 'Text', 'footnotes': 'fn1'})
+
+    def test_verse_record_rejects_unknown_fields(self):
+        """Test that fields a Verse cannot hold are rejected rather than dropped."""
+        with pytest.raises(ValueError, match="study_note"):
+            Verse.from_dict({'number': 1, 'text': 'Text', 'study_note': 'sn1'})
+
+    @pytest.mark.parametrize('note, expected', [
+        ({'id': 'sn1', 'reference': '83:1', 'content': 'A note.'}, True),
+        ({'id': 'sn1', 'reference': '83:1', 'content': '\n'}, False),
+        ({'id': 'sn1', 'content': 'A note.'}, False),
+    ])
+    def test_validate_study_note(self, note, expected):
+        """Test study note fields."""
+        assert validate_study_note(note) is expected
+
+    @pytest.mark.parametrize('footnote, expected', [
+        ({'id': 'fn1', 'content': 'Or "Selah."'}, True),
+        ({'id': 1, 'content': 'Or "Selah."'}, False),
+        ({'id': 'fn1', 'content': ''}, False),
+    ])
+    def test_validate_footnote(self, footnote, expected):
+        """Test footnote fields."""
+        assert validate_footnote(footnote) is expected
+
+    @pytest.mark.parametrize('xref, expected', [
+        ({'id': 'x1', 'verses': ['Ps 28:1', 'Ps 35:22']}, True),
+        ({'id': 'x1', 'verses': []}, False),
+        ({'id': 'x1', 'verses': [{'citation': 'Ps 28:1'}]}, False),
+        ({'verses': ['Ps 28:1']}, False),
+    ])
+    def test_validate_cross_reference(self, xref, expected):
+        """Test cross-reference fields."""
+        assert validate_cross_reference(xref) is expected
+
+    def test_compiled_validators_are_cached(self):
+        """Test that each schema is compiled once and then reused."""
+        pytest.importorskip('fastjsonschema')
+        _get_validator.cache_clear()
+
+        for _ in range(3):
+            validate_verse_structure({'number': 1, 'text': 'Text'})
+            validate_chapter_completeness(_chapter(), expected_verses=3)
+
+        assert _get_validator('verse') is _get_validator('verse')
+        assert _get_validator.cache_info().currsize == len(_SCHEMAS)
+
+
+class TestChapterValidation:
+    """Tests for whole-chapter validation."""
+
+    def test_valid_chapter_has_no_errors(self):
+        """Test that a complete chapter passes."""
+        assert validate_chapter_completeness(_chapter(), expected_verses=3) == []
+        assert is_valid_chapter_data(_chapter(), expected_verses=3)
+
+    def test_chapter_errors_are_reported(self):
+        """Test that count, numbering and item errors are all reported."""
+        data = _chapter()
+        data['verses'][1]['number'] = 5
+        data['footnotes'].append({'id': 'fn2', 'content': ' '})
+
+        errors = validate_chapter_completeness(data, expected_verses=4)
+
+        assert errors == [
+            "Expected 4 verses, found 3",
+            "Verse at index 1 has number 5, expected 2",
+            "Invalid footnote structure at index 1",
+        ]
+
+    def test_structure_errors_precede_numbering_errors(self):
+        """Test that every verse is checked in both passes."""
+        data = _chapter()
+        data['verses'][0] = {'number': 1, 'text': ''}
+        data['verses'][2]['number'] = '3'
+
+        errors = validate_chapter_completeness(data, expected_verses=3)
+
+        assert errors == [
+            "Invalid verse structure at index 0",
+            "Invalid verse structure at index 2",
+            "Verse at index 2 has number 3, expected 3",
+        ]
+
+    def test_numbering_check_specialized_per_length(self):
+        """Test that chapters of the same length share one expected sequence."""
+        _expected_verse_numbers.cache_clear()
+
+        for _ in range(3):
+            validate_chapter_completeness(_chapter(18), expected_verses=18)
+        validate_chapter_completeness(_chapter(31), expected_verses=31)
+
+        info = _expected_verse_numbers.cache_info()
+        assert (info.misses, info.hits) == (2, 2)
+
+    def test_chapter_of_verse_records(self):
+        """Test that Verse records are validated alongside verse dictionaries."""
+        data = _chapter()
+        data['verses'] = [Verse.from_dict(verse) for verse in data['verses']]
+        assert validate_chapter_completeness(data, expected_verses=3) == []
+        
+        data['verses'][1] = Verse(5, ' ')
+        
+        assert validate_chapter_completeness(data, expected_verses=3) == [
+            "Invalid verse structure at index 1",
+            "Verse at index 1 has number 5, expected 2",
+        ]
+
+    def test_chapter_columns(self):
+        """Test that column-wise validation reports the same verse errors."""
+        data = _chapter()
+        data['verses'][0]['text'] = ' '
+        data['verses'][2]['number'] = 5
+
+        columns = ChapterColumns.from_dict(data)
+
+        assert columns.numbers == (1, 2, 5)
+        assert validate_chapter_columns(columns, expected_verses=3) == [
+            "Invalid verse structure at index 0",
+            "Verse at index 2 has number 5, expected 3",
+        ]
+        assert validate_chapter_columns(ChapterColumns.from_dict(_chapter()), expected_verses=3) == []
+
+    def test_is_valid_chapter_data_rejects_bad_shapes(self):
+        """Test the quick check on malformed input."""
+        assert not is_valid_chapter_data([])
+        assert not is_valid_chapter_data({'book': 'Psalms', 'chapter': 83})
+        assert not is_valid_chapter_data(_chapter(), expected_verses=18)
+
+    def test_shallow_check_skips_verse_structure(self):
+        """Test that deep=False only checks the chapter shape."""
+        data = _chapter()
+        data['verses'][0]['text'] = ''
+
+        assert not is_valid_chapter_data(data)
+        assert is_valid_chapter_data(data, deep=False)
+        assert is_valid_chapter_shape(data, expected_verses=3)
+        assert not is_valid_chapter_shape({'book': 'Psalms', 'chapter': 83, 'verses': None})
+
+
+class TestPsalms83Validation:
+    """Tests for the Psalms 83 specific checks."""
+
+    def test_sample_passes(self, psalms_83_sample):
+        """Test that the sample chapter meets every Psalms 83 requirement."""
+        assert validate_psalms_83_specific(psalms_83_sample) == []
+
+    def test_missing_key_words_are_reported(self, psalms_83_sample):
+        """Test the superscription, verse 18 and Selah key word checks."""
+        psalms_83_sample['superscription'] = 'A song.'
+        psalms_83_sample['verses'][17]['text'] = 'May people know that you alone are over all the earth.'
+        psalms_83_sample['footnotes'] = [{'id': 'fn1', 'content': 'Or "pause."'}]
+
+        errors = validate_psalms_83_specific(psalms_83_sample)
+
+        assert errors == [
+            "Superscription should mention Asaph",
+            "Verse 18 should contain 'Jehovah'",
+            "Verse 18 should contain 'Most High'",
+            "Should have a Selah footnote",
+        ]